@@ -1,24 +1,51 @@
 #!/usr/bin/env python3
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def create_directory(path):
-    """Create a directory if it doesn't exist."""
-    if not os.path.exists(path):
+    """Create a directory if it doesn't exist and return a status line."""
+    try:
         os.makedirs(path)
-        print(f"Created directory: {path}")
-    else:
-        print(f"Directory already exists: {path}")
+    except FileExistsError:
+        return f"Directory already exists: {path}"
+    return f"Created directory: {path}"
+
+def create_file(path, content=b""):
+    """Create a file with optional content if it doesn't exist and return a status line."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return f"File already exists: {path}"
+    try:
+        if content:
+            _write_content(fd, content)
+    finally:
+        os.close(fd)
+    return f"Created file: {path}"
+
+def _existing(dirpath):
+    """Return the names of all entries in a directory using a single listing."""
+    try:
+        with os.scandir(dirpath) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
 
-def create_file(path, content=""):
-    """Create a file with optional content if it doesn't exist."""
-    if not os.path.exists(path):
-        with open(path, 'w') as f:
-            f.write(content)
-        print(f"Created file: {path}")
+def create_file_fast(path, content, existing):
+    """Create a file unless its name is in a precomputed set of existing entries."""
+    if path.name in existing:
+        return f"File already exists: {path}"
+    return create_file(path, content)
+
+def _write_content(fd, content):
+    """Write a bytes blob to an open descriptor in a single syscall."""
+    if hasattr(os, "writev"):
+        os.writev(fd, [memoryview(content)])
     else:
-        print(f"File already exists: {path}")
+        # os.writev is not available on Windows
+        os.write(fd, content)
 
 def init_file_content(module_name):
     """Generate content for __init__.py files."""
@@ -26,122 +53,14 @@ def init_file_content(module_name):
 
 """
 
-def setup_project_structure(base_dir):
-    """Create the Forex AI Trading project structure."""
-    # Create base directory
-    create_directory(base_dir)
-    
-    # Configuration files
-    config_dir = os.path.join(base_dir, "config")
-    create_directory(config_dir)
-    create_file(os.path.join(config_dir, "main.yml"), "# Core settings (pairs, timeframes, paths)\n")
-    create_file(os.path.join(config_dir, "models.yml"), "# Model hyperparameters\n")
-    create_file(os.path.join(config_dir, "strategies.yml"), "# Strategy definitions\n")
-    
-    # Data module
-    data_dir = os.path.join(base_dir, "data")
-    create_directory(data_dir)
-    create_file(os.path.join(data_dir, "fetcher.py"), "# MT5 data acquisition\n")
-    create_file(os.path.join(data_dir, "database.py"), "# Database operations\n")
-    create_file(os.path.join(data_dir, "resampler.py"), "# Timeframe conversion\n")
-    create_file(os.path.join(data_dir, "updater.py"), "# Scheduled data updates\n")
-    create_file(os.path.join(data_dir, "__init__.py"), init_file_content("Data"))
-    
-    # Models module
-    models_dir = os.path.join(base_dir, "models")
-    create_directory(models_dir)
-    create_file(os.path.join(models_dir, "drl.py"), "# DRL implementation (Stable Baselines3)\n")
-    create_file(os.path.join(models_dir, "features.py"), "# Feature engineering with LSTM\n")
-    create_file(os.path.join(models_dir, "training.py"), "# Model training pipeline\n")
-    create_file(os.path.join(models_dir, "registry.py"), "# Model storage and retrieval\n")
-    create_file(os.path.join(models_dir, "__init__.py"), init_file_content("Models"))
-    
-    # Indicators module
-    indicators_dir = os.path.join(base_dir, "indicators")
-    create_directory(indicators_dir)
-    create_file(os.path.join(indicators_dir, "base.py"), "# Base indicator class\n")
-    create_file(os.path.join(indicators_dir, "standard.py"), "# Standard indicators (RSI, MACD, etc.)\n")
-    create_file(os.path.join(indicators_dir, "registry.py"), "# Indicator registration\n")
-    create_file(os.path.join(indicators_dir, "__init__.py"), init_file_content("Indicators"))
-    
-    # Strategies module
-    strategies_dir = os.path.join(base_dir, "strategies")
-    create_directory(strategies_dir)
-    create_file(os.path.join(strategies_dir, "manager.py"), "# Strategy loading and management\n")
-    create_file(os.path.join(strategies_dir, "evaluator.py"), "# Strategy evaluation logic\n")
-    create_file(os.path.join(strategies_dir, "factory.py"), "# Strategy creation helpers\n")
-    create_file(os.path.join(strategies_dir, "__init__.py"), init_file_content("Strategies"))
-    
-    # Backtesting module
-    backtesting_dir = os.path.join(base_dir, "backtesting")
-    create_directory(backtesting_dir)
-    create_file(os.path.join(backtesting_dir, "engine.py"), "# Backtesting simulation\n")
-    create_file(os.path.join(backtesting_dir, "metrics.py"), "# Performance metrics\n")
-    create_file(os.path.join(backtesting_dir, "visualization.py"), "# Results visualization\n")
-    create_file(os.path.join(backtesting_dir, "__init__.py"), init_file_content("Backtesting"))
-    
-    # Trading module
-    trading_dir = os.path.join(base_dir, "trading")
-    create_directory(trading_dir)
-    create_file(os.path.join(trading_dir, "bridge.py"), "# ZeroMQ communication\n")
-    create_file(os.path.join(trading_dir, "risk.py"), "# Risk management\n")
-    create_file(os.path.join(trading_dir, "execution.py"), "# Trade execution logic\n")
-    create_file(os.path.join(trading_dir, "monitor.py"), "# Trade monitoring\n")
-    create_file(os.path.join(trading_dir, "__init__.py"), init_file_content("Trading"))
-    
-    # MT5 module
-    mt5_dir = os.path.join(base_dir, "mt5")
-    create_directory(mt5_dir)
-    create_file(os.path.join(mt5_dir, "ForexAI_EA.mq5"), "// MT5 Expert Advisor\n")
-    create_file(os.path.join(mt5_dir, "ZMQ_Bridge.mqh"), "// ZeroMQ implementation\n")
-    create_file(os.path.join(mt5_dir, "Utilities.mqh"), "// Common MT5 utilities\n")
-    
-    # Database module
-    db_dir = os.path.join(base_dir, "db")
-    create_directory(db_dir)
-    create_file(os.path.join(db_dir, "connector.py"), "# Database connection handling\n")
-    create_file(os.path.join(db_dir, "schema.py"), "# Database schema definition\n")
-    db_migrations_dir = os.path.join(db_dir, "migrations")
-    create_directory(db_migrations_dir)
-    create_file(os.path.join(db_dir, "__init__.py"), init_file_content("Database"))
-    
-    # Utilities module
-    utils_dir = os.path.join(base_dir, "utils")
-    create_directory(utils_dir)
-    create_file(os.path.join(utils_dir, "logger.py"), "# Logging utilities\n")
-    create_file(os.path.join(utils_dir, "config.py"), "# Configuration utilities\n")
-    create_file(os.path.join(utils_dir, "datetime.py"), "# Date/time handling\n")
-    create_file(os.path.join(utils_dir, "math.py"), "# Common math operations\n")
-    create_file(os.path.join(utils_dir, "testing.py"), "# Testing utilities\n")
-    create_file(os.path.join(utils_dir, "__init__.py"), init_file_content("Utilities"))
-    
-    # Scripts
-    scripts_dir = os.path.join(base_dir, "scripts")
-    create_directory(scripts_dir)
-    create_file(os.path.join(scripts_dir, "install.py"), "# Installation script\n")
-    create_file(os.path.join(scripts_dir, "data_updater.py"), "# Script for scheduled data updates\n")
-    create_file(os.path.join(scripts_dir, "backtest.py"), "# CLI for backtesting\n")
-    create_file(os.path.join(scripts_dir, "train_model.py"), "# CLI for model training\n")
-    
-    # Tests
-    tests_dir = os.path.join(base_dir, "tests")
-    create_directory(tests_dir)
-    create_directory(os.path.join(tests_dir, "data"))
-    create_directory(os.path.join(tests_dir, "models"))
-    create_directory(os.path.join(tests_dir, "indicators"))
-    create_directory(os.path.join(tests_dir, "strategies"))
-    create_file(os.path.join(tests_dir, "__init__.py"), init_file_content("Tests"))
-    
-    # Documentation
-    docs_dir = os.path.join(base_dir, "docs")
-    create_directory(docs_dir)
-    create_file(os.path.join(docs_dir, "setup.md"), "# Setup Instructions\n")
-    create_file(os.path.join(docs_dir, "usage.md"), "# Usage Guide\n")
-    create_file(os.path.join(docs_dir, "api.md"), "# API Documentation\n")
-    create_file(os.path.join(docs_dir, "examples.md"), "# Usage Examples\n")
-    
-    # Root files
-    create_file(os.path.join(base_dir, ".gitignore"), """# Python
+# Static file bodies, encoded once at import time
+_INIT_BLOBS = {
+    name: init_file_content(name).encode("utf-8")
+    for name in ("Data", "Models", "Indicators", "Strategies", "Backtesting",
+                 "Trading", "Database", "Utilities", "Tests")
+}
+
+GITIGNORE_BYTES = b"""# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -176,11 +95,12 @@ ENV/
 # Project specific
 *.log
 .env
+.scaffold_v*
 models/trained/
 data/raw/
-""")
-    
-    create_file(os.path.join(base_dir, "requirements.txt"), """# Core dependencies
+"""
+
+REQUIREMENTS_BYTES = b"""# Core dependencies
 numpy>=1.20.0
 pandas>=1.3.0
 matplotlib>=3.4.0
@@ -203,9 +123,9 @@ pyyaml>=6.0
 python-dotenv>=0.19.0
 click>=8.0.0
 tqdm>=4.62.0
-""")
-    
-    create_file(os.path.join(base_dir, "setup.py"), """from setuptools import setup, find_packages
+"""
+
+SETUP_PY_BYTES = b"""from setuptools import setup, find_packages
 
 setup(
     name="drl_forex_trading_internal",
@@ -233,9 +153,9 @@ setup(
     keywords="forex, trading, ai, reinforcement learning",
     python_requires=">=3.8",
 )
-""")
-    
-    create_file(os.path.join(base_dir, "README.md"), """# AI Forex Trading Bot
+"""
+
+README_BYTES = b"""# AI Forex Trading Bot
 
 ## Project Overview
 This project involves developing a modular, scalable AI-powered Forex trading system for MetaTrader 5 (MT5). The system combines Deep Reinforcement Learning (DRL) with technical indicators to make trading decisions, execute trades, and manage risk.
@@ -254,16 +174,154 @@ See the documentation in the docs/ folder for setup and usage instructions.
 
 ## License
 [Your License Here]
-""")
+"""
+
+# Project layout: (subdirectory, [(file name, content), ...]) relative to the project root.
+# Parent directories are listed before their children; "" is the project root itself.
+LAYOUT = [
+    ("config", [
+        ("main.yml", b"# Core settings (pairs, timeframes, paths)\n"),
+        ("models.yml", b"# Model hyperparameters\n"),
+        ("strategies.yml", b"# Strategy definitions\n"),
+    ]),
+    ("data", [
+        ("fetcher.py", b"# MT5 data acquisition\n"),
+        ("database.py", b"# Database operations\n"),
+        ("resampler.py", b"# Timeframe conversion\n"),
+        ("updater.py", b"# Scheduled data updates\n"),
+        ("__init__.py", _INIT_BLOBS["Data"]),
+    ]),
+    ("models", [
+        ("drl.py", b"# DRL implementation (Stable Baselines3)\n"),
+        ("features.py", b"# Feature engineering with LSTM\n"),
+        ("training.py", b"# Model training pipeline\n"),
+        ("registry.py", b"# Model storage and retrieval\n"),
+        ("__init__.py", _INIT_BLOBS["Models"]),
+    ]),
+    ("indicators", [
+        ("base.py", b"# Base indicator class\n"),
+        ("standard.py", b"# Standard indicators (RSI, MACD, etc.)\n"),
+        ("registry.py", b"# Indicator registration\n"),
+        ("__init__.py", _INIT_BLOBS["Indicators"]),
+    ]),
+    ("strategies", [
+        ("manager.py", b"# Strategy loading and management\n"),
+        ("evaluator.py", b"# Strategy evaluation logic\n"),
+        ("factory.py", b"# Strategy creation helpers\n"),
+        ("__init__.py", _INIT_BLOBS["Strategies"]),
+    ]),
+    ("backtesting", [
+        ("engine.py", b"# Backtesting simulation\n"),
+        ("metrics.py", b"# Performance metrics\n"),
+        ("visualization.py", b"# Results visualization\n"),
+        ("__init__.py", _INIT_BLOBS["Backtesting"]),
+    ]),
+    ("trading", [
+        ("bridge.py", b"# ZeroMQ communication\n"),
+        ("risk.py", b"# Risk management\n"),
+        ("execution.py", b"# Trade execution logic\n"),
+        ("monitor.py", b"# Trade monitoring\n"),
+        ("__init__.py", _INIT_BLOBS["Trading"]),
+    ]),
+    ("mt5", [
+        ("ForexAI_EA.mq5", b"// MT5 Expert Advisor\n"),
+        ("ZMQ_Bridge.mqh", b"// ZeroMQ implementation\n"),
+        ("Utilities.mqh", b"// Common MT5 utilities\n"),
+    ]),
+    ("db", [
+        ("connector.py", b"# Database connection handling\n"),
+        ("schema.py", b"# Database schema definition\n"),
+        ("__init__.py", _INIT_BLOBS["Database"]),
+    ]),
+    ("db/migrations", []),
+    ("utils", [
+        ("logger.py", b"# Logging utilities\n"),
+        ("config.py", b"# Configuration utilities\n"),
+        ("datetime.py", b"# Date/time handling\n"),
+        ("math.py", b"# Common math operations\n"),
+        ("testing.py", b"# Testing utilities\n"),
+        ("__init__.py", _INIT_BLOBS["Utilities"]),
+    ]),
+    ("scripts", [
+        ("install.py", b"# Installation script\n"),
+        ("data_updater.py", b"# Script for scheduled data updates\n"),
+        ("backtest.py", b"# CLI for backtesting\n"),
+        ("train_model.py", b"# CLI for model training\n"),
+    ]),
+    ("tests", [
+        ("__init__.py", _INIT_BLOBS["Tests"]),
+    ]),
+    ("tests/data", []),
+    ("tests/models", []),
+    ("tests/indicators", []),
+    ("tests/strategies", []),
+    ("docs", [
+        ("setup.md", b"# Setup Instructions\n"),
+        ("usage.md", b"# Usage Guide\n"),
+        ("api.md", b"# API Documentation\n"),
+        ("examples.md", b"# Usage Examples\n"),
+    ]),
+    ("", [
+        (".gitignore", GITIGNORE_BYTES),
+        ("requirements.txt", REQUIREMENTS_BYTES),
+        ("setup.py", SETUP_PY_BYTES),
+        ("README.md", README_BYTES),
+    ]),
+]
+
+# Written after a successful run; bump the version whenever LAYOUT changes
+SCAFFOLD_SENTINEL = ".scaffold_v1"
+
+# Only leaf directories need an explicit makedirs call; it creates every missing parent
+_SUBDIRS = [subdir for subdir, _ in LAYOUT if subdir]
+LEAF_DIRS = [d for d in _SUBDIRS if not any(other.startswith(d + "/") for other in _SUBDIRS)]
+
+def setup_project_structure(base_dir):
+    """Create the Forex AI Trading project structure."""
+    base = Path(base_dir)
+    sentinel = base / SCAFFOLD_SENTINEL
+    
+    # A previous run of this scaffold version already completed
+    if sentinel.exists():
+        sys.stdout.write(f"Project structure already up to date: {base.resolve()}\n")
+        return
+    
+    leaf_dirs = [base / subdir for subdir in LEAF_DIRS]
+    
+    # Creating files is syscall-bound and releases the GIL, so overlap it across threads.
+    # Results are collected in manifest order to keep the output deterministic.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # All directories must exist before any file is written
+        messages = list(executor.map(create_directory, leaf_dirs))
+        
+        # List each directory once instead of probing every file individually
+        file_paths = []
+        file_contents = []
+        file_existing = []
+        for subdir, files in LAYOUT:
+            directory = base / subdir if subdir else base
+            existing = _existing(directory) if files else set()
+            for name, content in files:
+                file_paths.append(directory / name)
+                file_contents.append(content)
+                file_existing.append(existing)
+        
+        messages.extend(executor.map(create_file_fast, file_paths, file_contents, file_existing))
+    
+    create_file(sentinel)
     
-    print("\nProject structure created successfully!")
-    print(f"Project directory: {os.path.abspath(base_dir)}")
+    # Emit the whole log with one write instead of one console write per entry
+    messages.append("\nProject structure created successfully!")
+    messages.append(f"Project directory: {base.resolve()}")
+    sys.stdout.write("\n".join(messages) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         project_dir = sys.argv[1]
     else:
-        project_dir = "drl_forex_trading_internal_internal"
-    project_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)))
+        # Default to the directory containing this script
+        project_dir = os.path.dirname(os.path.abspath(__file__))
     
-    setup_project_structure(project_dir)
\ No newline at end of file
+    setup_project_structure(project_dir)
@@ -1,10 +1,32 @@
 """
 Data package for the Forex AI Trading system.
 Handles fetching, storing, and processing of forex data.
+
+Submodules are imported lazily on first attribute access, so importing the
+package does not pull in MetaTrader5, SQLAlchemy or pandas until needed.
 """
-from drl_forex_trading_internal.data.fetcher import MT5Fetcher
-from drl_forex_trading_internal.data.database import DataManager
-from drl_forex_trading_internal.data.resampler import DataResampler
-from drl_forex_trading_internal.data.updater import DataUpdater
+import importlib
+
+__all__ = ["MT5Fetcher", "get_fetcher", "DataManager", "get_data_manager", "DataResampler", "DataUpdater"]
+
+# Map of exported names to (module, attribute)
+_LAZY_EXPORTS = {
+    "MT5Fetcher": ("drl_forex_trading_internal.data.fetcher", "MT5Fetcher"),
+    "get_fetcher": ("drl_forex_trading_internal.data.fetcher", "get_fetcher"),
+    "DataManager": ("drl_forex_trading_internal.data.database", "DataManager"),
+    "get_data_manager": ("drl_forex_trading_internal.data.database", "get_data_manager"),
+    "DataResampler": ("drl_forex_trading_internal.data.resampler", "DataResampler"),
+    "DataUpdater": ("drl_forex_trading_internal.data.updater", "DataUpdater"),
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        # Cache on the module so later lookups bypass __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ["MT5Fetcher", "DataManager", "DataResampler", "DataUpdater"]
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,13 +2,18 @@
 Database operations for the forex data module.
 Handles storing and retrieving OHLCV data.
 """
+import io
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union, Tuple
-import sqlalchemy
-from sqlalchemy import and_, or_, func, desc, asc, Table, Column, DateTime, Float, MetaData, Index
+from typing import Iterator, List, Dict, Optional, Union, Tuple
+from sqlalchemy import or_, func, desc, asc, text, Table, Column, DateTime, Float, REAL, Index
 from sqlalchemy.sql import select, exists
+from sqlalchemy.exc import OperationalError
+from psycopg2.extras import execute_values
 
 from drl_forex_trading_internal.utils.logger import get_logger
 from drl_forex_trading_internal.utils.config import load_config
@@ -18,6 +23,80 @@ from drl_forex_trading_internal.db.schema import create_price_table
 # Create logger
 logger = get_logger("data.database")
 
+# DataManager shared by callers that don't need their own
+_data_manager: Optional["DataManager"] = None
+_DATA_MANAGER_LOCK = threading.Lock()
+
+# Number of writes to each price table made by this process, keyed by "schema.table";
+# readers caching derived data compare these to notice new or rewritten rows
+_WRITE_VERSIONS: Dict[str, int] = {}
+_WRITE_VERSIONS_LOCK = threading.Lock()
+
+# Candle length in seconds for each supported timeframe
+TF_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+# INSERT ... VALUES %s ON CONFLICT DO UPDATE statements per price table, keyed by "schema.table"
+_INSERT_STMT_CACHE: Dict[str, str] = {}
+
+# Maximum rows per INSERT statement (6 columns each, well below PostgreSQL's 65535 bind parameters)
+INSERT_CHUNK_SIZE = 10_000
+
+# Loads of this many rows or more are written with COPY instead of INSERT
+COPY_MIN_ROWS = 5_000
+
+def _upsert_clause(columns) -> str:
+    """
+    Build the ON CONFLICT clause that overwrites a stored candle.
+    
+    Args:
+        columns: Column names being written (including timestamp)
+        
+    Returns:
+        ON CONFLICT (timestamp) DO UPDATE SET ... clause
+    """
+    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in columns if col != 'timestamp')
+    return f"ON CONFLICT (timestamp) DO UPDATE SET {updates}"
+
+def _decode_price_column(values: np.ndarray, column: Column) -> np.ndarray:
+    """
+    Strip float32 noise from values read from a REAL (float4) column.
+    
+    float4 holds 6-7 significant digits, so rounding to 7 significant digits
+    returns quoted prices exactly (1.08765 rather than 1.0876500606536865).
+    Double precision columns are returned unchanged.
+    
+    Args:
+        values: Column values as float64
+        column: Table column the values were read from
+        
+    Returns:
+        Decoded float64 values
+    """
+    if not isinstance(column.type, REAL):
+        return values
+        
+    magnitude = np.floor(np.log10(np.abs(values), out=np.zeros_like(values), where=values != 0))
+    scale = 10.0 ** (6 - magnitude)
+    return np.round(values * scale) / scale
+
+def _bump_write_version(table_name: str) -> None:
+    """
+    Record a write to a price table.
+    
+    Args:
+        table_name: Schema-qualified table name
+    """
+    with _WRITE_VERSIONS_LOCK:
+        _WRITE_VERSIONS[table_name] = _WRITE_VERSIONS.get(table_name, 0) + 1
+
 class DataManager:
     """
     Class to manage data storage and retrieval from the database.
@@ -28,70 +107,103 @@ class DataManager:
         self.config = load_config()
         self.data_config = self.config["data"]
         self.engine = get_engine()
-        self.metadata = MetaData(schema='price_data')
-        self.metadata.reflect(bind=self.engine)
-        self.tables = {}  # Cache for table objects
+        
+        # Parse market open/close hours once per weekday (first config entry per day wins)
+        self._open_hours = [0] * 7     # Default open at 00:00
+        self._close_hours = [22] * 7   # Default close at 22:00
+        seen_days = set()
+        for hours in self.config["calendar"].get("forex_market_open", []):
+            day = hours.get("day")
+            if day not in range(7) or day in seen_days:
+                continue
+            seen_days.add(day)
+            self._open_hours[day] = int(hours.get("time", "00:00").split(":")[0])
+            self._close_hours[day] = int(hours.get("time", "22:00").split(":")[0])
+            
+        # Pair name -> ID map, filled by the first successful ensure_currency_pairs call
+        self._pair_map: Optional[Dict[str, int]] = None
         
     def ensure_currency_pairs(self) -> Dict[str, int]:
         """
         Ensure all configured currency pairs exist in the database.
         
+        The configuration is fixed for the life of the process, so the database is
+        only consulted on the first successful call; later calls return the cached map.
+        
         Returns:
             Dictionary mapping currency pair names to their IDs
         """
+        if self._pair_map is not None:
+            return dict(self._pair_map)
+            
         pair_map = {}
         session = get_session()
         
         try:
             # Get all pairs from config
             config_pairs = self.data_config["currency_pairs"]
+            names = [pair_config["name"] for pair_config in config_pairs]
+            
+            # Load all existing pairs in a single query
+            existing = {
+                pair.name: pair
+                for pair in session.query(CurrencyPair).filter(CurrencyPair.name.in_(names)).all()
+            }
+            
+            pairs = {}
+            created = []
+            updated = []
             
             for pair_config in config_pairs:
                 pair_name = pair_config["name"]
+                description = pair_config.get("description", "")
+                pip_value = pair_config.get("pip_value", 0.0001)
+                spread_avg = pair_config.get("spread_avg", 0)
                 
-                # Check if pair exists
-                pair = session.query(CurrencyPair).filter_by(name=pair_name).first()
+                pair = existing.get(pair_name)
                 
                 if pair is None:
                     # Create new pair
                     pair = CurrencyPair(
                         name=pair_name,
-                        description=pair_config.get("description", ""),
-                        pip_value=pair_config.get("pip_value", 0.0001),
-                        spread_avg=pair_config.get("spread_avg", 0)
+                        description=description,
+                        pip_value=pip_value,
+                        spread_avg=spread_avg
                     )
                     session.add(pair)
-                    session.commit()
-                    logger.info(f"Created new currency pair: {pair_name}")
-                else:
+                    created.append(pair_name)
+                    existing[pair_name] = pair
+                elif (pair.description != description or
+                      pair.pip_value != pip_value or
+                      pair.spread_avg != spread_avg):
                     # Update existing pair if needed
-                    updated = False
-                    
-                    if pair.description != pair_config.get("description", ""):
-                        pair.description = pair_config.get("description", "")
-                        updated = True
-                        
-                    if pair.pip_value != pair_config.get("pip_value", 0.0001):
-                        pair.pip_value = pair_config.get("pip_value", 0.0001)
-                        updated = True
-                        
-                    if pair.spread_avg != pair_config.get("spread_avg", 0):
-                        pair.spread_avg = pair_config.get("spread_avg", 0)
-                        updated = True
-                        
-                    if updated:
-                        session.commit()
-                        logger.info(f"Updated currency pair: {pair_name}")
+                    pair.description = description
+                    pair.pip_value = pip_value
+                    pair.spread_avg = spread_avg
+                    updated.append(pair_name)
                 
-                # Ensure price table exists for this pair
-                table_name = f"{pair_name.lower()}_1m"
-                if table_name not in self.metadata.tables:
-                    self._ensure_price_table(pair_name)
-                
-                # Add to map
-                pair_map[pair_name] = pair.id
+                pairs[pair_name] = pair
+            
+            if created:
+                # Flush so new pairs are assigned their IDs
+                session.flush()
+            
+            pair_map = {name: pair.id for name, pair in pairs.items()}
+            
+            if created or updated:
+                # Commit all inserts and updates at once
+                session.commit()
+                for pair_name in created:
+                    logger.info(f"Created new currency pair: {pair_name}")
+                for pair_name in updated:
+                    logger.info(f"Updated currency pair: {pair_name}")
+            
+            # Ensure price table exists for each pair
+            for pair_name in pairs:
+                self._ensure_price_table(pair_name)
             
-            return pair_map
+            self._pair_map = pair_map
+            return dict(pair_map)
             
         except Exception as e:
             session.rollback()
@@ -112,28 +224,41 @@ class DataManager:
         Returns:
             SQLAlchemy Table object
         """
-        table_name = f"{pair_name.lower()}_{timeframe}"
-        schema_table_name = f"price_data.{table_name}"
-        
-        # Check if table is already in our cache
-        if table_name in self.tables:
-            return self.tables[table_name]
-        
-        # Check if table exists in database
-        insp = sqlalchemy.inspect(self.engine)
-        if insp.has_table(table_name, schema='price_data'):
-            # Table exists, get it from metadata
-            table = Table(table_name, self.metadata, autoload_with=self.engine, schema='price_data')
-            self.tables[table_name] = table
-            return table
-        
-        # Table doesn't exist, create it
-        logger.info(f"Creating price table for {pair_name} with timeframe {timeframe}")
-        table = create_price_table(self.engine, pair_name, timeframe)
-        self.tables[table_name] = table
-        return table
+        # db.schema owns the process-wide price table cache and creates missing tables
+        return create_price_table(self.engine, pair_name, timeframe)
+    
+    @contextmanager
+    def _price_transaction(self, timeframes: List[str]) -> Iterator:
+        """
+        Open a transaction for writing price rows.
+        
+        Transactions that only write 1m data commit without waiting for the WAL
+        flush: those rows can always be re-fetched from MT5, so losing the last
+        few commits on a server crash is acceptable. Resampled data is only
+        rebuilt for the recent lookback window, so its commits stay synchronous.
+        
+        Args:
+            timeframes: Timeframes written in the transaction
+            
+        Yields:
+            SQLAlchemy connection with an open transaction
+        """
+        written = set()
+        with self.engine.begin() as conn:
+            if all(timeframe == "1m" for timeframe in timeframes):
+                # Applies to this transaction only
+                conn.execute(text("SET LOCAL synchronous_commit = off"))
+            conn.info['written_price_tables'] = written
+            try:
+                yield conn
+            finally:
+                conn.info.pop('written_price_tables', None)
+                
+        # Bump again once committed, so anything cached while the transaction was open is invalidated too
+        for table_name in written:
+            _bump_write_version(table_name)
     
-    def store_price_data(self, pair_name: str, data: pd.DataFrame, timeframe: str = "1m") -> bool:
+    def store_price_data(self, pair_name: str, data: pd.DataFrame, timeframe: str = "1m", use_copy: bool = False) -> bool:
         """
         Store price data for a currency pair.
         
@@ -141,6 +266,8 @@ class DataManager:
             pair_name: Currency pair name
             data: DataFrame with OHLCV data
             timeframe: Timeframe string
+            use_copy: Load through COPY and a staging table regardless of batch size
+                (suited to backfills that mostly overlap stored rows)
             
         Returns:
             bool: True if successful, False otherwise
@@ -153,69 +280,356 @@ class DataManager:
             # Get the price table for this pair
             table = self._ensure_price_table(pair_name, timeframe)
             
-            # Reset index if time is the index
-            if data.index.name == 'time':
-                data = data.reset_index()
-                
-            # Ensure 'time' column exists
-            if 'time' not in data.columns:
-                logger.error(f"DataFrame does not have a 'time' column")
+            insert_df = self._prepare_insert_df(data)
+            if insert_df is None:
                 return False
                 
-            # Get existing timestamps to avoid conflicts with primary key
-            existing_times = set()
+            logger.info(f"Storing {len(insert_df)} records for {pair_name}")
             
-            # Check for existing timestamps in the table
-            with self.engine.connect() as conn:
-                min_time = data['time'].min()
-                max_time = data['time'].max()
+            # Store in database
+            with self._price_transaction([timeframe]) as conn:  # Use transaction
+                self._write_price_records(conn, table, insert_df, pair_name, use_copy=use_copy)
+            
+            logger.info(f"Successfully stored {len(insert_df)} records for {pair_name} (existing timestamps updated)")
+            return True
+            
+        except OperationalError as e:
+            # Connection-level failures are expected now and then; the traceback adds nothing
+            logger.error(f"Database unavailable while storing price data for {pair_name}: {e}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error storing price data for {pair_name}: {e}", exc_info=True)
+            return False
+    
+    def store_price_rates(self, pair_name: str, rates: np.ndarray, timeframe: str = "1m") -> bool:
+        """
+        Store MT5 rates for a currency pair without going through a fetcher DataFrame.
+        
+        Args:
+            pair_name: Currency pair name
+            rates: MT5 structured rates array (as returned by MT5Fetcher.fetch_ohlcv_raw)
+            timeframe: Timeframe string
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if rates is None or len(rates) == 0:
+            logger.warning(f"No data to store for {pair_name}")
+            return False
+        
+        try:
+            # Get the price table for this pair
+            table = self._ensure_price_table(pair_name, timeframe)
+            
+            # Build the storage columns straight from the structured array's fields
+            insert_df = pd.DataFrame({
+                'timestamp': rates['time'].astype('datetime64[s]').astype('datetime64[ns]'),
+                'open': np.round(rates['open'], 6),
+                'high': np.round(rates['high'], 6),
+                'low': np.round(rates['low'], 6),
+                'close': np.round(rates['close'], 6),
+                'volume': rates['tick_volume'].astype(np.float64),
+            })
+            
+            logger.info(f"Storing {len(insert_df)} records for {pair_name}")
+            
+            # Store in database
+            with self._price_transaction([timeframe]) as conn:  # Use transaction
+                self._write_price_records(conn, table, insert_df, pair_name)
+            
+            logger.info(f"Successfully stored {len(insert_df)} records for {pair_name} (existing timestamps updated)")
+            return True
+            
+        except OperationalError as e:
+            # Connection-level failures are expected now and then; the traceback adds nothing
+            logger.error(f"Database unavailable while storing price data for {pair_name}: {e}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error storing price data for {pair_name}: {e}", exc_info=True)
+            return False
+    
+    def store_price_data_bulk(self, pair_name: str, frames: List[Tuple[str, pd.DataFrame]]) -> Dict[str, bool]:
+        """
+        Store price data for several timeframes of a currency pair in one transaction.
+        
+        Args:
+            pair_name: Currency pair name
+            frames: List of (timeframe, DataFrame with OHLCV data) tuples
+            
+        Returns:
+            Dictionary mapping timeframes to success status
+        """
+        results = {}
+        prepared = []
+        
+        try:
+            for timeframe, data in frames:
+                if data is None or len(data) == 0:
+                    logger.warning(f"No data to store for {pair_name} {timeframe}")
+                    results[timeframe] = False
+                    continue
+                    
+                insert_df = self._prepare_insert_df(data)
+                if insert_df is None:
+                    results[timeframe] = False
+                    continue
+                    
+                table = self._ensure_price_table(pair_name, timeframe)
+                prepared.append((timeframe, table, insert_df))
+            
+            # Store every timeframe over one connection and transaction
+            with self._price_transaction([timeframe for timeframe, _, _ in prepared]) as conn:
+                for timeframe, table, insert_df in prepared:
+                    self._write_price_records(conn, table, insert_df, pair_name)
+                    
+            for timeframe, _, insert_df in prepared:
+                results[timeframe] = True
+                logger.info(f"Successfully stored {len(insert_df)} {timeframe} records for {pair_name} (existing timestamps updated)")
                 
-                # Use modern SQLAlchemy 2.0 style query
-                query = select(table.c.timestamp).where(
-                    and_(
-                        table.c.timestamp >= min_time,
-                        table.c.timestamp <= max_time
-                    )
-                )
+        except OperationalError as e:
+            logger.error(f"Database unavailable while storing price data for {pair_name}: {e}")
+            for timeframe, _ in frames:
+                results[timeframe] = False
                 
-                result = conn.execute(query)
-                existing_times = {row[0] for row in result}
-            
-            # Count initial records
-            initial_count = len(data)
+        except Exception as e:
+            logger.error(f"Error storing price data for {pair_name}: {e}", exc_info=True)
+            for timeframe, _ in frames:
+                results[timeframe] = False
+                
+        return results
+        
+    def store_price_data_many(self, datasets: Dict[str, pd.DataFrame], timeframe: str = "1m") -> Dict[str, bool]:
+        """
+        Store price data for several currency pairs in one transaction.
+        
+        Args:
+            datasets: Dictionary mapping pair names to DataFrames with OHLCV data
+            timeframe: Timeframe string
             
-            # Filter out existing timestamps
-            if existing_times:
-                data = data[~data['time'].isin(existing_times)]
+        Returns:
+            Dictionary mapping pair names to success status
+        """
+        results = {}
+        prepared = []
+        
+        try:
+            for pair_name, data in datasets.items():
+                if data is None or len(data) == 0:
+                    logger.warning(f"No data to store for {pair_name}")
+                    results[pair_name] = False
+                    continue
+                    
+                insert_df = self._prepare_insert_df(data)
+                if insert_df is None:
+                    results[pair_name] = False
+                    continue
+                    
+                table = self._ensure_price_table(pair_name, timeframe)
+                prepared.append((pair_name, table, insert_df))
                 
-            # Check if we have any new data
-            if len(data) == 0:
-                logger.info(f"No new data to store for {pair_name}")
-                return True
+            # Store every pair over one connection and transaction
+            with self._price_transaction([timeframe]) as conn:
+                for pair_name, table, insert_df in prepared:
+                    self._write_price_records(conn, table, insert_df, pair_name)
+                    
+            for pair_name, _, insert_df in prepared:
+                results[pair_name] = True
+                logger.info(f"Successfully stored {len(insert_df)} {timeframe} records for {pair_name} (existing timestamps updated)")
                 
-            logger.info(f"Storing {len(data)} new records out of {initial_count} for {pair_name}")
+        except OperationalError as e:
+            logger.error(f"Database unavailable while storing {timeframe} price data for {', '.join(datasets)}: {e}")
+            for pair_name in datasets:
+                results[pair_name] = False
                 
-            # Convert DataFrame to list of dictionaries for insertion
-            records = []
-            for _, row in data.iterrows():
-                records.append({
-                    'timestamp': row['time'],
-                   'open': round(float(row['open']), 6),
-                    'high': round(float(row['high']), 6),
-                    'low': round(float(row['low']), 6),
-                    'close': round(float(row['close']), 6),
-                    'volume': float(row['volume'])
-                })
+        except Exception as e:
+            logger.error(f"Error storing {timeframe} price data for {', '.join(datasets)}: {e}", exc_info=True)
+            for pair_name in datasets:
+                results[pair_name] = False
                 
-            # Store in database
-            with self.engine.begin() as conn:  # Use transaction
-                conn.execute(table.insert(), records)
+        return results
+
+    def _prepare_insert_df(self, data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Select and coerce the columns of an OHLCV DataFrame for storage.
+        
+        Args:
+            data: DataFrame with OHLCV data, indexed by or with a 'time' column
+            
+        Returns:
+            DataFrame with timestamp, open, high, low, close and volume columns,
+            or None if there is no time column
+        """
+        # Reset index if time is the index
+        if data.index.name == 'time':
+            data = data.reset_index()
+            
+        # Ensure 'time' column exists
+        if 'time' not in data.columns:
+            logger.error("DataFrame does not have a 'time' column")
+            return None
+            
+        # Dtype coercion and rounding are done column-wise, not per row
+        ohlc = ['open', 'high', 'low', 'close']
+        insert_df = data[['time'] + ohlc + ['volume']].astype(
+            {col: 'float64' for col in ohlc + ['volume']}
+        )
+        insert_df[ohlc] = insert_df[ohlc].round(6)
+        return insert_df.rename(columns={'time': 'timestamp'})
+    
+    def _write_price_records(self, conn, table: Table, insert_df: pd.DataFrame, pair_name: str, use_copy: bool = False) -> None:
+        """
+        Write prepared price rows to a price table, upserting on timestamp.
+        
+        Args:
+            conn: SQLAlchemy connection with an open transaction
+            table: Price table to write to
+            insert_df: DataFrame returned by _prepare_insert_df
+            pair_name: Currency pair name (for logging)
+            use_copy: Always use the COPY path, whatever the batch size
+        """
+        _bump_write_version(table.fullname)
+        written = conn.info.get('written_price_tables')
+        if written is not None:
+            written.add(table.fullname)
+            
+        # ON CONFLICT DO UPDATE rejects a batch that hits the same row twice
+        if insert_df['timestamp'].duplicated().any():
+            insert_df = insert_df.drop_duplicates('timestamp', keep='last')
+            
+        if use_copy or len(insert_df) >= COPY_MIN_ROWS:
+            # Large loads go through COPY, which is much faster than any INSERT path
+            self._copy_price_records(conn, table, insert_df)
+            return
+            
+        # Rows whose timestamp is already stored are overwritten by the database
+        # (the latest bar is revised until it closes), so no pre-query is needed
+        sql = _INSERT_STMT_CACHE.get(table.fullname)
+        if sql is None:
+            # Built once per table
+            target = self.engine.dialect.identifier_preparer.format_table(table)
+            columns = ", ".join(insert_df.columns)
+            sql = f"INSERT INTO {target} ({columns}) VALUES %s {_upsert_clause(insert_df.columns)}"
+            _INSERT_STMT_CACHE[table.fullname] = sql
             
-            logger.info(f"Successfully stored {len(records)} records for {pair_name}")
+        # Plain tuples straight from the column arrays, rather than one dict per row
+        rows = list(zip(
+            insert_df['timestamp'].to_numpy(dtype='datetime64[us]').tolist(),
+            *(insert_df[col].to_numpy().tolist() for col in insert_df.columns if col != 'timestamp')
+        ))
+        
+        cursor = conn.connection.cursor()
+        try:
+            # Chunked to stay under the per-statement parameter limit
+            for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+                chunk = rows[i:i + INSERT_CHUNK_SIZE]
+                execute_values(cursor, sql, chunk, page_size=INSERT_CHUNK_SIZE)
+                logger.debug("Inserted chunk of %d records for %s (%d/%d)", len(chunk), pair_name, i + len(chunk), len(rows))
+        finally:
+            cursor.close()
+    
+    def _copy_price_records(self, conn, table: Table, insert_df: pd.DataFrame) -> None:
+        """
+        Bulk load price rows with COPY into a temporary table, then upsert them
+        into the price table.
+        
+        Args:
+            conn: SQLAlchemy connection with an open transaction
+            table: Price table to load into
+            insert_df: DataFrame with timestamp, open, high, low, close and volume columns
+        """
+        target = self.engine.dialect.identifier_preparer.format_table(table)
+        columns = ", ".join(insert_df.columns)
+        
+        # Serialize the rows to CSV in memory
+        buf = io.StringIO()
+        insert_df.to_csv(buf, index=False, header=False)
+        buf.seek(0)
+        
+        cursor = conn.connection.cursor()
+        try:
+            # ON COMMIT DROP cleans up the temporary table if the load fails part-way
+            cursor.execute(f"CREATE TEMP TABLE tmp_price_load (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP")
+            cursor.copy_expert(f"COPY tmp_price_load ({columns}) FROM STDIN WITH (FORMAT CSV)", buf)
+            cursor.execute(
+                f"INSERT INTO {target} ({columns}) SELECT {columns} FROM tmp_price_load "
+                f"{_upsert_clause(insert_df.columns)}"
+            )
+            # Drop now so another load in the same transaction can reuse the name
+            cursor.execute("DROP TABLE tmp_price_load")
+        finally:
+            cursor.close()
+    
+    def drop_secondary_indexes(self, pair_name: str, timeframe: str = "1m") -> List[str]:
+        """
+        Drop the non-unique indexes of a price table ahead of a large load.
+        
+        The primary key is kept, since inserts rely on it for ON CONFLICT.
+        
+        Args:
+            pair_name: Currency pair name
+            timeframe: Timeframe string
+            
+        Returns:
+            List of CREATE INDEX statements for the dropped indexes (pass to recreate_indexes)
+        """
+        table_name = f"{pair_name.lower()}_{timeframe}"
+        preparer = self.engine.dialect.identifier_preparer
+        
+        query = text(
+            "SELECT i.relname, pg_get_indexdef(i.oid) "
+            "FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid "
+            "WHERE x.indrelid = CAST(:table AS regclass) AND NOT x.indisprimary AND NOT x.indisunique"
+        )
+        
+        try:
+            with self.engine.begin() as conn:
+                indexes = conn.execute(query, {"table": f"price_data.{preparer.quote(table_name)}"}).all()
+                for index_name, _ in indexes:
+                    conn.execute(text(f"DROP INDEX IF EXISTS price_data.{preparer.quote(index_name)}"))
+                    
+            logger.info(f"Dropped {len(indexes)} secondary indexes on {table_name}")
+            return [definition for _, definition in indexes]
+            
+        except Exception as e:
+            logger.error(f"Error dropping indexes on {table_name}: {e}", exc_info=True)
+            return []
+    
+    def recreate_indexes(self, pair_name: str, definitions: List[str], parallel: bool = True) -> bool:
+        """
+        Recreate indexes dropped by drop_secondary_indexes.
+        
+        Args:
+            pair_name: Currency pair name (for logging)
+            definitions: CREATE INDEX statements returned by drop_secondary_indexes
+            parallel: Whether to build the indexes concurrently on separate connections
+            
+        Returns:
+            bool: True if all indexes were recreated, False otherwise
+        """
+        if not definitions:
+            return True
+            
+        def build(definition: str) -> None:
+            # CONCURRENTLY cannot run inside a transaction block
+            statement = definition.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY IF NOT EXISTS ", 1)
+            with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text(statement))
+        
+        try:
+            if parallel and len(definitions) > 1:
+                with ThreadPoolExecutor(max_workers=len(definitions)) as executor:
+                    list(executor.map(build, definitions))
+            else:
+                for definition in definitions:
+                    build(definition)
+                    
+            logger.info(f"Recreated {len(definitions)} indexes for {pair_name}")
             return True
             
         except Exception as e:
-            logger.error(f"Error storing price data for {pair_name}: {e}", exc_info=True)
+            logger.error(f"Error recreating indexes for {pair_name}: {e}", exc_info=True)
             return False
     
     def get_price_data(
@@ -224,7 +638,8 @@ class DataManager:
         timeframe: str = "1m",
         start_date: Optional[Union[datetime, str]] = None,
         end_date: Optional[Union[datetime, str]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        before: Optional[datetime] = None
     ) -> Optional[pd.DataFrame]:
         """
         Get price data for a currency pair from the database.
@@ -235,9 +650,13 @@ class DataManager:
             start_date: Start date for data retrieval
             end_date: End date for data retrieval
             limit: Maximum number of records to retrieve
+            before: Keyset cursor; with limit, return the latest records strictly before
+                this timestamp (pass the first index of the previous page to page backwards)
             
         Returns:
-            DataFrame with OHLCV data or None if error or no data
+            DataFrame with OHLCV data or None if error or no data. Columns stored
+            as REAL (float4) hold about 7 significant digits and are rounded to
+            that on read; double precision columns are returned as stored.
         """
         try:
             # Get the price table for this pair
@@ -250,8 +669,9 @@ class DataManager:
             if isinstance(end_date, str):
                 end_date = datetime.strptime(end_date, "%Y-%m-%d")
                 
-            # Build query
-            query = select(table)
+            # Build query with an explicit column list
+            columns = [table.c.timestamp, table.c.open, table.c.high, table.c.low, table.c.close, table.c.volume]
+            query = select(*columns)
             
             if start_date:
                 query = query.where(table.c.timestamp >= start_date)
@@ -259,26 +679,37 @@ class DataManager:
             if end_date:
                 query = query.where(table.c.timestamp <= end_date)
                 
-            # Order by timestamp
-            query = query.order_by(table.c.timestamp)
+            if before is not None:
+                # Walk the primary key backwards from the cursor; rows are flipped back below
+                query = query.where(table.c.timestamp < before).order_by(table.c.timestamp.desc())
+            else:
+                # Order by timestamp
+                query = query.order_by(table.c.timestamp)
             
             # Apply limit if specified
             if limit:
                 query = query.limit(limit)
                 
-            # Execute query
             with self.engine.connect() as conn:
-                result = conn.execute(query)
-                rows = result.fetchall()
+                rows = conn.execute(query).all()
             
             if not rows:
                 logger.warning(f"No data found for {pair_name} in specified date range")
                 return None
                 
-            # Convert to DataFrame
-            df = pd.DataFrame(rows, columns=result.keys())
-            df = df.rename(columns={'timestamp': 'time'})
-            df.set_index('time', inplace=True)
+            if before is not None:
+                rows.reverse()
+                
+            # Build the columns directly from the row tuples, skipping read_sql's type inference
+            count = len(rows)
+            values = list(zip(*rows))
+            df = pd.DataFrame(
+                {
+                    column.name: _decode_price_column(np.fromiter(values[i], dtype=np.float64, count=count), column)
+                    for i, column in enumerate(columns[1:], start=1)
+                },
+                index=pd.DatetimeIndex(values[0], name='time'),
+            )
             
             logger.info(f"Retrieved {len(df)} records for {pair_name}")
             return df
@@ -287,6 +718,47 @@ class DataManager:
             logger.error(f"Error retrieving price data for {pair_name}: {e}", exc_info=True)
             return None
     
+    def get_latest_timestamp(self, pair_name: str, timeframe: str = "1m") -> Optional[datetime]:
+        """
+        Get the most recent stored timestamp for a currency pair.
+        
+        Answered from the primary key index, so it is cheap enough to call before every read.
+        
+        Args:
+            pair_name: Currency pair name
+            timeframe: Timeframe string
+            
+        Returns:
+            Latest timestamp, or None if the table is empty or on error
+        """
+        try:
+            table = self._ensure_price_table(pair_name, timeframe)
+            
+            with self.engine.connect() as conn:
+                return conn.execute(select(func.max(table.c.timestamp))).scalar()
+                
+        except Exception as e:
+            logger.error(f"Error getting latest timestamp for {pair_name}: {e}", exc_info=True)
+            return None
+    
+    def get_write_version(self, pair_name: str, timeframe: str = "1m") -> int:
+        """
+        Get the number of writes this process has made to a price table.
+        
+        The value changes whenever rows are inserted or updated through this
+        module, including upserts that rewrite existing candles. Writes made
+        by other processes are not counted.
+        
+        Args:
+            pair_name: Currency pair name
+            timeframe: Timeframe string
+            
+        Returns:
+            Write version of the table (0 if never written)
+        """
+        table = self._ensure_price_table(pair_name, timeframe)
+        return _WRITE_VERSIONS.get(table.fullname, 0)
+    
     def find_data_gaps(self, pair_name: str, timeframe: str = "1m") -> List[Tuple[datetime, datetime]]:
         """
         Find gaps in the price data for a currency pair.
@@ -302,56 +774,33 @@ class DataManager:
             # Get the price table for this pair
             table = self._ensure_price_table(pair_name, timeframe)
             
-            # Get all timestamps for the pair
-            query = select(table.c.timestamp).order_by(table.c.timestamp)
-            
-            with self.engine.connect() as conn:
-                result = conn.execute(query)
-                timestamps = [row[0] for row in result]
-            
-            if not timestamps:
-                logger.warning(f"No data found for {pair_name}")
-                return []
-                
             # Calculate expected time delta based on timeframe
-            if timeframe == "1m":
-                expected_delta = timedelta(minutes=1)
-            elif timeframe == "5m":
-                expected_delta = timedelta(minutes=5)
-            elif timeframe == "15m":
-                expected_delta = timedelta(minutes=15)
-            elif timeframe == "30m":
-                expected_delta = timedelta(minutes=30)
-            elif timeframe == "1h":
-                expected_delta = timedelta(hours=1)
-            elif timeframe == "4h":
-                expected_delta = timedelta(hours=4)
-            elif timeframe == "1d":
-                expected_delta = timedelta(days=1)
-            else:
+            if timeframe not in TF_SECONDS:
                 logger.error(f"Unsupported timeframe for gap detection: {timeframe}")
                 return []
+            expected_delta = timedelta(seconds=TF_SECONDS[timeframe])
                 
-            # Find gaps
-            gaps = []
-            for i in range(1, len(timestamps)):
-                current = timestamps[i]
-                previous = timestamps[i-1]
-                actual_delta = current - previous
-                
-                # Calculate expected number of intervals
-                expected_intervals = int(actual_delta.total_seconds() / expected_delta.total_seconds())
-                
-                # Check if there's a gap (more than one expected interval)
-                if expected_intervals > 1:
-                    # Check if gap is during weekend (for forex)
-                    gap_start = previous
-                    gap_end = current
-                    
-                    # Skip gaps during weekends for forex markets
-                    if not self._is_weekend_gap(gap_start, gap_end):
-                        gaps.append((gap_start, gap_end))
-                        
+            # Let the database diff consecutive timestamps and return only the gaps
+            # (more than one expected interval between neighbouring candles)
+            prev_ts = func.lag(table.c.timestamp).over(order_by=table.c.timestamp)
+            deltas = select(table.c.timestamp.label('ts'), prev_ts.label('prev_ts')).subquery()
+            query = (
+                select(deltas.c.prev_ts, deltas.c.ts)
+                .where(deltas.c.ts - deltas.c.prev_ts >= expected_delta * 2)
+                .order_by(deltas.c.ts)
+            )
+            
+            with self.engine.connect() as conn:
+                result = conn.execute(query)
+                candidates = result.fetchall()
+            
+            # Skip gaps during weekends for forex markets
+            gaps = [
+                (gap_start, gap_end)
+                for gap_start, gap_end in candidates
+                if not self._is_weekend_gap(gap_start, gap_end)
+            ]
+            
             logger.info(f"Found {len(gaps)} data gaps for {pair_name} at {timeframe}")
             return gaps
             
@@ -395,13 +844,7 @@ class DataManager:
         Returns:
             Hour of market close (default 22 for forex)
         """
-        market_hours = self.config["calendar"].get("forex_market_open", [])
-        for hours in market_hours:
-            if hours.get("day") == day:
-                time_str = hours.get("time", "22:00")
-                return int(time_str.split(":")[0])
-                
-        return 22  # Default close at 22:00
+        return self._close_hours[day]
     
     def _get_market_open_time(self, day: int) -> int:
         """
@@ -413,13 +856,7 @@ class DataManager:
         Returns:
             Hour of market open (default 0 for forex)
         """
-        market_hours = self.config["calendar"].get("forex_market_open", [])
-        for hours in market_hours:
-            if hours.get("day") == day:
-                time_str = hours.get("time", "00:00")
-                return int(time_str.split(":")[0])
-                
-        return 0  # Default open at 00:00
+        return self._open_hours[day]
     
     def get_data_coverage(self, pair_name: str, timeframe: str = "1m") -> Dict:
         """
@@ -436,36 +873,21 @@ class DataManager:
             # Get the price table for this pair
             table = self._ensure_price_table(pair_name, timeframe)
             
-            # Get min and max timestamps and count
+            # Get min and max timestamps and count in a single round-trip
             with self.engine.connect() as conn:
-                min_time = conn.execute(select(func.min(table.c.timestamp))).scalar()
-                max_time = conn.execute(select(func.max(table.c.timestamp))).scalar()
-                count = conn.execute(select(func.count(table.c.timestamp))).scalar()
+                min_time, max_time, count = conn.execute(
+                    select(
+                        func.min(table.c.timestamp),
+                        func.max(table.c.timestamp),
+                        func.count(table.c.timestamp)
+                    )
+                ).one()
             
             # Calculate expected count based on timeframe
             if min_time and max_time:
-                # Calculate time delta in minutes
-                if timeframe == "1m":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes
-                elif timeframe == "5m":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes / 5
-                elif timeframe == "15m":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes / 15
-                elif timeframe == "30m":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes / 30
-                elif timeframe == "1h":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes / 60
-                elif timeframe == "4h":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes / 240
-                elif timeframe == "1d":
-                    minutes = int((max_time - min_time).total_seconds() / 60)
-                    expected_count = minutes / 1440
+                # Expected number of candles between the first and last timestamp
+                if timeframe in TF_SECONDS:
+                    expected_count = int((max_time - min_time).total_seconds() / TF_SECONDS[timeframe])
                 else:
                     expected_count = 0
                 
@@ -475,27 +897,8 @@ class DataManager:
                     days = (max_time - min_time).days
                     weekends = days // 7
                     
-                    if timeframe == "1m":
-                        weekend_minutes = weekends * 48 * 60
-                        expected_count -= weekend_minutes
-                    elif timeframe == "5m":
-                        weekend_minutes = weekends * 48 * 12
-                        expected_count -= weekend_minutes
-                    elif timeframe == "15m":
-                        weekend_minutes = weekends * 48 * 4
-                        expected_count -= weekend_minutes
-                    elif timeframe == "30m":
-                        weekend_minutes = weekends * 48 * 2
-                        expected_count -= weekend_minutes
-                    elif timeframe == "1h":
-                        weekend_minutes = weekends * 48
-                        expected_count -= weekend_minutes
-                    elif timeframe == "4h":
-                        weekend_minutes = weekends * 12
-                        expected_count -= weekend_minutes
-                    elif timeframe == "1d":
-                        weekend_minutes = weekends * 2
-                        expected_count -= weekend_minutes
+                    if timeframe in TF_SECONDS:
+                        expected_count -= (weekends * 48 * 3600) // TF_SECONDS[timeframe]
                 
                 # Calculate coverage percentage
                 expected_count = max(0, expected_count)
@@ -516,4 +919,20 @@ class DataManager:
             
         except Exception as e:
             logger.error(f"Error getting data coverage for {pair_name}: {e}", exc_info=True)
-            return {}
\ No newline at end of file
+            return {}
+
+def get_data_manager() -> DataManager:
+    """
+    Get the shared DataManager instance.
+    Creates it on first use.
+    
+    Returns:
+        DataManager instance
+    """
+    global _data_manager
+    
+    with _DATA_MANAGER_LOCK:
+        if _data_manager is None:
+            _data_manager = DataManager()
+            
+    return _data_manager
@@ -3,6 +3,8 @@ MT5 data fetcher module for the Forex AI Trading system.
 Responsible for retrieving historical price data from MetaTrader 5.
 """
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Union, Tuple
 import pandas as pd
 import numpy as np
@@ -28,6 +30,14 @@ TIMEFRAME_MAP = {
     "MN1": mt5.TIMEFRAME_MN1
 }
 
+# The MetaTrader5 package talks to the terminal over one IPC session per process,
+# so every MT5 call goes through this lock; concurrent fetches only overlap the
+# DataFrame building and database work around those calls
+_MT5_LOCK = threading.RLock()
+
+# Shared fetcher instance
+_fetcher: Optional["MT5Fetcher"] = None
+
 class MT5Fetcher:
     """
     Class to fetch historical price data from MetaTrader 5.
@@ -39,11 +49,28 @@ class MT5Fetcher:
         self.mt5_config = self.config["mt5"]
         self.data_config = self.config["data"]
         self.is_initialized = False
+        self.max_candles = int(self.data_config["update"]["max_candles_per_request"])
+        
+        # Symbol availability results (positive and negative), valid until shutdown
+        self._symbol_available: Dict[str, bool] = {}
         
     def initialize(self) -> bool:
         """
         Initialize connection to MetaTrader 5.
         
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self.is_initialized:
+            return True
+        
+        with _MT5_LOCK:
+            return self._initialize_locked()
+    
+    def _initialize_locked(self) -> bool:
+        """
+        Initialize connection to MetaTrader 5 while holding the MT5 lock.
+        
         Returns:
             bool: True if successful, False otherwise
         """
@@ -74,10 +101,12 @@ class MT5Fetcher:
     
     def shutdown(self):
         """Shutdown MT5 connection."""
-        if self.is_initialized:
-            mt5.shutdown()
-            self.is_initialized = False
-            logger.info("MT5 connection closed")
+        with _MT5_LOCK:
+            if self.is_initialized:
+                mt5.shutdown()
+                self.is_initialized = False
+                self._symbol_available.clear()
+                logger.info("MT5 connection closed")
     
     def check_symbol_available(self, symbol: str) -> bool:
         """
@@ -91,16 +120,25 @@ class MT5Fetcher:
         """
         if not self.is_initialized and not self.initialize():
             return False
+        
+        # Reuse the result of an earlier check for this symbol
+        available = self._symbol_available.get(symbol)
+        if available is not None:
+            return available
             
-        symbol_info = mt5.symbol_info(symbol)
+        with _MT5_LOCK:
+            symbol_info = mt5.symbol_info(symbol)
         if symbol_info is None:
             logger.warning(f"Symbol {symbol} not found in MT5")
+            self._symbol_available[symbol] = False
             return False
             
         if not symbol_info.visible:
             logger.info(f"Symbol {symbol} is not visible, attempting to make it visible")
-            mt5.symbol_select(symbol, True)
-            
+            with _MT5_LOCK:
+                mt5.symbol_select(symbol, True)
+        
+        self._symbol_available[symbol] = True
         return True
     
     def fetch_ohlcv(
@@ -124,6 +162,40 @@ class MT5Fetcher:
         Returns:
             pandas.DataFrame with OHLCV data or None if error
         """
+        rates = self.fetch_ohlcv_raw(symbol, timeframe, start_date, end_date, count)
+        if rates is None:
+            return None
+            
+        # Convert to pandas DataFrame
+        df = self._rates_to_dataframe(rates)
+        logger.info(f"Retrieved {len(df)} bars for {symbol} {timeframe}")
+        return df
+    
+    def fetch_ohlcv_raw(
+        self, 
+        symbol: str, 
+        timeframe: str = "M1", 
+        start_date: Optional[Union[datetime.datetime, str]] = None,
+        end_date: Optional[Union[datetime.datetime, str]] = None,
+        count: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Fetch historical OHLCV data for a symbol as MT5's structured array.
+        
+        Skips the DataFrame conversion; NumPy-based consumers should prefer this
+        (and as_soa) over fetch_ohlcv. Fields are time (Unix seconds), open, high,
+        low, close, tick_volume, spread and real_volume.
+        
+        Args:
+            symbol: Symbol name (e.g., "EURUSD")
+            timeframe: Timeframe string (e.g., "M1", "H1")
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            count: Number of candles to retrieve (used if start_date is None)
+            
+        Returns:
+            Structured array of rates sorted by time, or None if error
+        """
         if not self.is_initialized and not self.initialize():
             return None
             
@@ -132,25 +204,27 @@ class MT5Fetcher:
             return None
             
         # Convert timeframe string to MT5 constant
-        if timeframe not in TIMEFRAME_MAP:
+        mt5_timeframe = TIMEFRAME_MAP.get(timeframe)
+        if mt5_timeframe is None:
             logger.error(f"Invalid timeframe: {timeframe}. Valid options: {list(TIMEFRAME_MAP.keys())}")
             return None
-            
-        mt5_timeframe = TIMEFRAME_MAP[timeframe]
+        
+        # Fast path for the common "most recent N bars" request
+        if start_date is None and count is not None and count <= self.max_candles:
+            return self._fetch_recent_rates(symbol, timeframe, mt5_timeframe, count)
+        
+        # Default to the starting date in config if none provided
+        if start_date is None and count is None:
+            start_date = datetime.datetime.strptime(self.data_config["start_date"], "%Y-%m-%d")
         
         # Process dates
         if start_date is None:
-            if count is None:
-                # Default to the starting date in config if none provided
-                start_date_str = self.data_config["start_date"]
-                start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d")
-            else:
-                # If count is provided but no dates, get the most recent data
-                rate_args = {
-                    "symbol": symbol,
-                    "timeframe": mt5_timeframe,
-                    "count": count
-                }
+            # If count is provided but no dates, get the most recent data
+            rate_args = {
+                "symbol": symbol,
+                "timeframe": mt5_timeframe,
+                "count": count
+            }
         else:
             # Convert string date to datetime if needed
             if isinstance(start_date, str):
@@ -169,48 +243,98 @@ class MT5Fetcher:
             }
         
         # Handle max candles per request
-        max_candles = self.data_config["update"]["max_candles_per_request"]
+        max_candles = self.max_candles
         
         if "count" in rate_args and rate_args["count"] > max_candles:
             logger.warning(f"Requested {rate_args['count']} candles, but max is {max_candles}. Using chunked requests.")
-            return self._fetch_large_ohlcv(symbol, mt5_timeframe, rate_args["count"])
+            return self._fetch_large_rates(symbol, mt5_timeframe, rate_args["count"])
             
         # Fetch data from MT5
         try:
             logger.info(f"Fetching {symbol} {timeframe} data with args: {rate_args}")
             
             # Choose the appropriate MT5 function based on provided arguments
-            if "from_date" in rate_args and "to_date" in rate_args:
-                # Date range query
-                rates = mt5.copy_rates_range(symbol, mt5_timeframe, 
-                                           rate_args["from_date"], 
-                                           rate_args["to_date"])
-            elif "from_date" in rate_args:
-                # From date to now query
-                rates = mt5.copy_rates_from(symbol, mt5_timeframe, 
-                                          rate_args["from_date"])
-            elif "count" in rate_args:
-                # Count-based query
-                rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 
-                                              0, rate_args["count"])
-            else:
-                logger.error("Invalid arguments for MT5 data request")
+            with _MT5_LOCK:
+                if "from_date" in rate_args and "to_date" in rate_args:
+                    # Date range query
+                    rates = mt5.copy_rates_range(symbol, mt5_timeframe, 
+                                               rate_args["from_date"], 
+                                               rate_args["to_date"])
+                elif "from_date" in rate_args:
+                    # From date to now query
+                    rates = mt5.copy_rates_from(symbol, mt5_timeframe, 
+                                              rate_args["from_date"])
+                elif "count" in rate_args:
+                    # Count-based query
+                    rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 
+                                                  0, rate_args["count"])
+                else:
+                    logger.error("Invalid arguments for MT5 data request")
+                    return None
+            
+            if rates is None or len(rates) == 0:
+                logger.warning(f"No data returned for {symbol} {timeframe}")
                 return None
+                
+            return rates
+            
+        except Exception as e:
+            logger.error(f"Error fetching {symbol} {timeframe} data: {e}", exc_info=True)
+            return None
+            
+    def _fetch_recent_rates(self, symbol: str, timeframe: str, mt5_timeframe: int, count: int) -> Optional[np.ndarray]:
+        """
+        Fetch the most recent bars for a symbol with a single request.
+        
+        Args:
+            symbol: Symbol name
+            timeframe: Timeframe string (for logging)
+            mt5_timeframe: MT5 timeframe constant
+            count: Number of candles to retrieve (at most max_candles_per_request)
+            
+        Returns:
+            Structured array of rates or None if error
+        """
+        try:
+            with _MT5_LOCK:
+                rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, count)
             
             if rates is None or len(rates) == 0:
                 logger.warning(f"No data returned for {symbol} {timeframe}")
                 return None
                 
-            # Convert to pandas DataFrame
-            df = self._rates_to_dataframe(rates)
-            logger.info(f"Retrieved {len(df)} bars for {symbol} {timeframe}")
-            return df
+            return rates
             
         except Exception as e:
             logger.error(f"Error fetching {symbol} {timeframe} data: {e}", exc_info=True)
             return None
             
-    def _fetch_large_ohlcv(self, symbol: str, mt5_timeframe: int, count: int) -> Optional[pd.DataFrame]:
+    def fetch_ohlcv_many(self, requests: List[Dict]) -> Dict[Tuple[str, str], Optional[pd.DataFrame]]:
+        """
+        Fetch OHLCV data for several symbols/timeframes concurrently.
+        
+        Args:
+            requests: List of fetch_ohlcv keyword argument dicts, each with at least "symbol"
+            
+        Returns:
+            Dictionary mapping (symbol, timeframe) to the fetched DataFrame (or None if error)
+        """
+        if not requests:
+            return {}
+            
+        # Connect once up front so the worker threads don't race to initialize
+        if not self.is_initialized and not self.initialize():
+            return {}
+        
+        max_workers = self.data_config["update"].get("max_parallel_requests", 4)
+        keys = [(request["symbol"], request.get("timeframe", "M1")) for request in requests]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            results = list(executor.map(lambda request: self.fetch_ohlcv(**request), requests))
+            
+        return dict(zip(keys, results))
+        
+    def _fetch_large_rates(self, symbol: str, mt5_timeframe: int, count: int) -> Optional[np.ndarray]:
         """
         Fetch large amount of OHLCV data by breaking into chunks.
         
@@ -220,45 +344,67 @@ class MT5Fetcher:
             count: Total number of candles to retrieve
             
         Returns:
-            pandas.DataFrame with OHLCV data or None if error
+            Structured array of rates sorted by time, or None if error
         """
-        max_candles = self.data_config["update"]["max_candles_per_request"]
-        chunks = []
-        remaining = count
-        position = 0
+        max_candles = self.max_candles
+        max_workers = self.data_config["update"].get("max_parallel_requests", 4)
         
-        while remaining > 0:
-            chunk_size = min(remaining, max_candles)
-            logger.info(f"Fetching chunk of {chunk_size} candles from position {position}")
-            
+        # Every full chunk returns exactly max_candles bars, so all chunk positions are known upfront
+        requests = [
+            (position, min(max_candles, count - position))
+            for position in range(0, count, max_candles)
+        ]
+        
+        def fetch_chunk(request):
+            position, chunk_size = request
+            # Lazy %-formatting: this runs once per chunk on large backfills
+            logger.info("Fetching chunk of %d candles from position %d", chunk_size, position)
             try:
-                rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, position, chunk_size)
-                if rates is None or len(rates) == 0:
-                    break
+                with _MT5_LOCK:
+                    return mt5.copy_rates_from_pos(symbol, mt5_timeframe, position, chunk_size)
+            except Exception as e:
+                logger.error(f"Error fetching chunk at position {position}: {e}", exc_info=True)
+                return None
+        
+        # Output buffer, allocated from the first chunk's dtype and filled in place
+        out = None
+        written = 0
+        
+        # Request a window of chunks concurrently; map() keeps the results in position order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(requests), max_workers):
+                window = requests[start:start + max_workers]
+                reached_end = False
+                
+                for (position, chunk_size), rates in zip(window, executor.map(fetch_chunk, window)):
+                    if rates is None or len(rates) == 0:
+                        reached_end = True
+                        break
+                        
+                    if out is None:
+                        out = np.empty(count, dtype=rates.dtype)
+                    out[written:written + len(rates)] = rates
+                    written += len(rates)
                     
-                chunks.append(self._rates_to_dataframe(rates))
-                position += len(rates)
-                remaining -= len(rates)
+                    # If we got fewer bars than requested, we've reached the end
+                    if len(rates) < chunk_size:
+                        reached_end = True
+                        break
                 
-                # If we got fewer bars than requested, we've reached the end
-                if len(rates) < chunk_size:
+                if reached_end:
                     break
-                    
-            except Exception as e:
-                logger.error(f"Error fetching chunk at position {position}: {e}", exc_info=True)
-                break
                 
-        if not chunks:
+        if out is None:
             return None
             
-        # Combine all chunks and sort by time
-        result = pd.concat(chunks).sort_values("time")
+        rates = out[:written]
         
-        # Remove duplicates if any
-        result = result.drop_duplicates(subset=["time"])
+        # Remove duplicates if any; np.unique also returns the indices in time order
+        _, unique_idx = np.unique(rates["time"], return_index=True)
+        rates = rates[unique_idx]
         
-        logger.info(f"Retrieved total of {len(result)} bars for {symbol}")
-        return result
+        logger.info(f"Retrieved total of {len(rates)} bars for {symbol}")
+        return rates
         
     def _rates_to_dataframe(self, rates) -> pd.DataFrame:
         """
@@ -270,26 +416,29 @@ class MT5Fetcher:
         Returns:
             pandas.DataFrame with formatted OHLCV data
         """
-        df = pd.DataFrame(rates)
+        # MT5 returns Unix seconds, which convert to datetime64 without a per-element parse
+        times = rates["time"].astype("datetime64[s]").astype("datetime64[ns]")
         
-        # Convert time column from Unix timestamp to datetime
-        df["time"] = pd.to_datetime(df["time"], unit="s")
-        
-        # Rename columns to standard OHLCV names and select only needed columns
-        df = df[["time", "open", "high", "low", "close", "tick_volume", "spread", "real_volume"]]
-        df = df.rename(columns={
-            "tick_volume": "volume",
-            "real_volume": "real_volume"
-        })
+        # Build the DataFrame straight from the structured array's columns,
+        # renaming tick_volume to the standard OHLCV volume name
+        df = pd.DataFrame(
+            {
+                "open": rates["open"],
+                "high": rates["high"],
+                "low": rates["low"],
+                "close": rates["close"],
+                "volume": rates["tick_volume"],
+                "spread": rates["spread"],
+                "real_volume": rates["real_volume"]
+            },
+            index=pd.DatetimeIndex(times, name="time")
+        )
         
         # Calculate spread in pips
         # For pairs ending with JPY, a pip is 0.01, for others it's 0.0001
         # This is a simplification and may need adjustment for some exotic pairs
         # df["spread_pips"] = df["spread"] * 0.1
         
-        # Set time as index
-        df.set_index("time", inplace=True)
-        
         return df
         
     def get_available_symbols(self) -> List[str]:
@@ -302,7 +451,8 @@ class MT5Fetcher:
         if not self.is_initialized and not self.initialize():
             return []
             
-        symbols = mt5.symbols_get()
+        with _MT5_LOCK:
+            symbols = mt5.symbols_get()
         if symbols is None:
             logger.warning("Failed to get symbol list from MT5")
             return []
@@ -322,7 +472,8 @@ class MT5Fetcher:
         if not self.is_initialized and not self.initialize():
             return {}
             
-        symbol_info = mt5.symbol_info(symbol)
+        with _MT5_LOCK:
+            symbol_info = mt5.symbol_info(symbol)
         if symbol_info is None:
             logger.warning(f"Symbol {symbol} not found in MT5")
             return {}
@@ -367,26 +518,71 @@ class MT5Fetcher:
         Returns:
             List of session dictionaries with open and close times
         """
-        sessions = []
+        if opens is None or closes is None or len(opens) == 0 or len(closes) == 0:
+            return []
         
-        if not opens or not closes:
-            return sessions
-            
-        for i in range(len(opens) // 2):  # MT5 stores 2 values per day
-            open_time = opens[day_index * 2 + i]
-            close_time = closes[day_index * 2 + i]
-            
-            # Skip empty sessions
-            if open_time == close_time == 0:
-                continue
-                
-            # Convert from minutes since midnight to HH:MM format
-            open_str = f"{open_time // 60:02d}:{open_time % 60:02d}"
-            close_str = f"{close_time // 60:02d}:{close_time % 60:02d}"
+        # MT5 stores 2 values per day
+        start = day_index * 2
+        stop = start + len(opens) // 2
+        open_times = np.asarray(opens, dtype=np.int32)[start:stop]
+        close_times = np.asarray(closes, dtype=np.int32)[start:stop]
+        
+        # Skip empty sessions
+        mask = (open_times != 0) | (close_times != 0)
+        open_times = open_times[mask]
+        close_times = close_times[mask]
+        
+        # Convert from minutes since midnight to HH:MM format
+        open_strs = _format_minutes(open_times)
+        close_strs = _format_minutes(close_times)
+        
+        sessions = [
+            {"open": open_str, "close": close_str}
+            for open_str, close_str in zip(open_strs, close_strs)
+        ]
             
-            sessions.append({
-                "open": open_str,
-                "close": close_str
-            })
+        return sessions
+
+def _format_minutes(minutes: np.ndarray) -> List[str]:
+    """
+    Format an array of minutes since midnight as HH:MM strings.
+    
+    Args:
+        minutes: Integer array of minutes since midnight
+        
+    Returns:
+        List of HH:MM strings
+    """
+    hours = np.char.zfill((minutes // 60).astype(str), 2)
+    mins = np.char.zfill((minutes % 60).astype(str), 2)
+    return np.char.add(np.char.add(hours, ":"), mins).tolist()
+
+def as_soa(rates: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Split a structured rates array into per-field arrays without copying.
+    
+    Each value is a strided view into the same buffer as the input.
+    
+    Args:
+        rates: Structured array as returned by MT5Fetcher.fetch_ohlcv_raw
+        
+    Returns:
+        Dictionary mapping field names to array views
+    """
+    return {name: rates[name] for name in rates.dtype.names}
+
+def get_fetcher() -> MT5Fetcher:
+    """
+    Get the shared MT5Fetcher instance.
+    Creates it on first use; the MT5 connection itself is opened lazily.
+    
+    Returns:
+        MT5Fetcher instance
+    """
+    global _fetcher
+    
+    with _MT5_LOCK:
+        if _fetcher is None:
+            _fetcher = MT5Fetcher()
             
-        return sessions
\ No newline at end of file
+    return _fetcher
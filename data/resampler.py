@@ -2,17 +2,143 @@
 Resampler module for the Forex AI Trading system.
 Handles resampling of price data from one timeframe to another.
 """
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from typing import Optional, Dict, List
 
 from drl_forex_trading_internal.utils.logger import get_logger
 from drl_forex_trading_internal.utils.config import load_config
-from drl_forex_trading_internal.data.database import DataManager
+from drl_forex_trading_internal.data.database import DataManager, get_data_manager
 
 # Create logger
 logger = get_logger("data.resampler")
 
+# Bucket width in nanoseconds for each timeframe
+_BUCKET_NS = {
+    "1m": 60 * 10**9,
+    "5m": 5 * 60 * 10**9,
+    "15m": 15 * 60 * 10**9,
+    "30m": 30 * 60 * 10**9,
+    "1h": 60 * 60 * 10**9,
+    "4h": 4 * 60 * 60 * 10**9,
+    "1d": 24 * 60 * 60 * 10**9,
+}
+
+_OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+def _can_reduce_directly(data: pd.DataFrame) -> bool:
+    """
+    Check whether data can be resampled with the NumPy bucket reduction.
+    
+    Args:
+        data: DataFrame with OHLCV data indexed by time
+        
+    Returns:
+        True if the index is a sorted naive DatetimeIndex and OHLCV has no NaNs
+    """
+    index = data.index
+    return (
+        isinstance(index, pd.DatetimeIndex)
+        and index.tz is None
+        and index.is_monotonic_increasing
+        and not data[_OHLCV_COLUMNS].isna().to_numpy().any()
+    )
+
+def _bucket_runs(ts_ns: np.ndarray, bucket_ns: int):
+    """
+    Split sorted timestamps into runs that fall in the same time bucket.
+    
+    Args:
+        ts_ns: Sorted int64 timestamps in nanoseconds
+        bucket_ns: Bucket width in nanoseconds
+        
+    Returns:
+        Tuple of (start row, end row, bucket start in ns) arrays, one entry per bucket
+    """
+    buckets = ts_ns // bucket_ns
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.append(starts[1:], len(ts_ns))
+    return starts, ends, buckets[starts] * bucket_ns
+
+def _reduce_ohlcv(data: pd.DataFrame, bucket_ns: int) -> pd.DataFrame:
+    """
+    Aggregate sorted OHLCV rows into fixed-width time buckets.
+    
+    Buckets are aligned to midnight, matching pandas resample for every
+    supported timeframe, and only non-empty buckets are returned.
+    
+    Args:
+        data: DataFrame with OHLCV data and a sorted DatetimeIndex
+        bucket_ns: Bucket width in nanoseconds
+        
+    Returns:
+        Resampled DataFrame indexed by bucket start time
+    """
+    ts = data.index.to_numpy().astype('datetime64[ns]').view('int64')
+    starts, ends, labels = _bucket_runs(ts, bucket_ns)
+    
+    return pd.DataFrame(
+        {
+            'open': data['open'].to_numpy()[starts],
+            'high': np.maximum.reduceat(data['high'].to_numpy(), starts),
+            'low': np.minimum.reduceat(data['low'].to_numpy(), starts),
+            'close': data['close'].to_numpy()[ends - 1],
+            'volume': np.add.reduceat(data['volume'].to_numpy(), starts)
+        },
+        index=pd.DatetimeIndex(labels.view('datetime64[ns]'), name=data.index.name)
+    )
+
+def resample_struct(arr: np.ndarray, source_timeframe: str, target_timeframe: str) -> np.ndarray:
+    """
+    Resample a structured OHLCV array without going through pandas.
+    
+    The array must be sorted by time and have time, open, high, low, close
+    and volume fields (as MT5 rates do, with tick_volume accepted for volume).
+    Integer times are taken as Unix seconds.
+    
+    Args:
+        arr: Structured array of OHLCV rows
+        source_timeframe: Source timeframe string (e.g., "1m")
+        target_timeframe: Target timeframe string (e.g., "1h")
+        
+    Returns:
+        Structured array with time (datetime64[ns]) and OHLCV fields, one row per bucket
+        
+    Raises:
+        ValueError: If a timeframe is not supported
+    """
+    for timeframe in (source_timeframe, target_timeframe):
+        if timeframe not in _BUCKET_NS:
+            raise ValueError(f"Invalid timeframe: {timeframe}")
+            
+    if source_timeframe == target_timeframe or len(arr) == 0:
+        return arr
+    
+    times = arr['time']
+    if np.issubdtype(times.dtype, np.integer):
+        times = times.astype('datetime64[s]')
+    ts = times.astype('datetime64[ns]').view('int64')
+    volume = arr['volume'] if 'volume' in arr.dtype.names else arr['tick_volume']
+    
+    starts, ends, labels = _bucket_runs(ts, _BUCKET_NS[target_timeframe])
+    
+    out = np.empty(len(starts), dtype=[
+        ('time', 'datetime64[ns]'),
+        ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'),
+        ('volume', volume.dtype)
+    ])
+    out['time'] = labels.view('datetime64[ns]')
+    out['open'] = arr['open'][starts]
+    out['high'] = np.maximum.reduceat(arr['high'], starts)
+    out['low'] = np.minimum.reduceat(arr['low'], starts)
+    out['close'] = arr['close'][ends - 1]
+    out['volume'] = np.add.reduceat(volume, starts)
+    return out
+
 class DataResampler:
     """
     Class to handle resampling of price data.
@@ -20,19 +146,80 @@ class DataResampler:
     
     # Map of timeframe strings to pandas resample rule
     TIMEFRAME_MAP = {
-        "1m": "1T",   # 1 minute
-        "5m": "5T",   # 5 minutes
-        "15m": "15T", # 15 minutes
-        "30m": "30T", # 30 minutes
-        "1h": "1H",   # 1 hour
-        "4h": "4H",   # 4 hours
-        "1d": "1D",   # 1 day
+        "1m": "1min",   # 1 minute
+        "5m": "5min",   # 5 minutes
+        "15m": "15min", # 15 minutes
+        "30m": "30min", # 30 minutes
+        "1h": "1h",     # 1 hour
+        "4h": "4h",     # 4 hours
+        "1d": "1D",     # 1 day
     }
     
-    def __init__(self):
-        """Initialize the resampler."""
+    def __init__(self, data_manager: Optional[DataManager] = None):
+        """
+        Initialize the resampler.
+        
+        Args:
+            data_manager: DataManager to use (defaults to one shared by all resamplers)
+        """
         self.config = load_config()
-        self.data_manager = DataManager()
+        self.data_manager = data_manager if data_manager is not None else get_data_manager()
+        
+        # (pair, timeframe) -> monotonic time of the last lookup that found the whole table empty
+        self._empty_cache: Dict[tuple, float] = {}
+        self._empty_cache_ttl = self.config["data"]["update"].get("empty_cache_ttl", 60)
+        
+        # (pair, timeframe, start ns, end ns) -> (1m write version, monotonic time cached, resampled DataFrame),
+        # least recent first
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._result_cache_size = self.config["data"]["update"].get("resample_cache_size", 256)
+        self._result_cache_ttl = self.config["data"]["update"].get("resample_cache_ttl", 60)
+        self._result_cache_lock = threading.Lock()
+    
+    def _is_known_empty(self, pair_name: str, timeframe: str = "1m") -> bool:
+        """
+        Check whether a recent lookup found no stored data at all for a pair/timeframe.
+        
+        Args:
+            pair_name: Currency pair name
+            timeframe: Timeframe string
+            
+        Returns:
+            True if the pair was empty within the last empty_cache_ttl seconds
+        """
+        missed_at = self._empty_cache.get((pair_name, timeframe))
+        if missed_at is None:
+            return False
+        if time.monotonic() - missed_at < self._empty_cache_ttl:
+            return True
+        del self._empty_cache[(pair_name, timeframe)]
+        return False
+    
+    def _get_m1_data(self, pair_name: str, start_date, end_date) -> Optional[pd.DataFrame]:
+        """
+        Get 1-minute data for a pair, skipping the query if the pair recently had no data at all.
+        
+        Args:
+            pair_name: Currency pair name
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            
+        Returns:
+            DataFrame with 1-minute OHLCV data or None if no data
+        """
+        if self._is_known_empty(pair_name):
+            return None
+            
+        m1_data = self.data_manager.get_price_data(pair_name, "1m", start_date, end_date)
+        if m1_data is None or m1_data.empty:
+            # An empty window says nothing about other windows; only skip later
+            # queries when the pair has no 1m data stored at all
+            if self.data_manager.get_latest_timestamp(pair_name, "1m") is None:
+                self._empty_cache[(pair_name, "1m")] = time.monotonic()
+            return None
+            
+        self._empty_cache.pop((pair_name, "1m"), None)
+        return m1_data
     
     def resample_data(
         self,
@@ -54,6 +241,10 @@ class DataResampler:
         if data is None or len(data) == 0:
             logger.warning("No data to resample")
             return None
+        
+        # If source and target are the same, just return the data (it is never modified)
+        if source_timeframe == target_timeframe:
+            return data
             
         try:
             # Ensure index is datetime
@@ -73,24 +264,24 @@ class DataResampler:
                 logger.error(f"Invalid target timeframe: {target_timeframe}")
                 return None
                 
-            # If source and target are the same, just return the data
-            if source_timeframe == target_timeframe:
-                return data
+            if _can_reduce_directly(data):
+                # Sorted data without NaNs: reduce contiguous runs of rows with NumPy
+                resampled = _reduce_ohlcv(data, _BUCKET_NS[target_timeframe])
+            else:
+                # Get resample rule
+                resample_rule = self.TIMEFRAME_MAP[target_timeframe]
                 
-            # Get resample rule
-            resample_rule = self.TIMEFRAME_MAP[target_timeframe]
-            
-            # Resample data
-            resampled = data.resample(resample_rule).agg({
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            })
-            
-            # Drop rows with NaN values
-            resampled = resampled.dropna()
+                # Resample data
+                resampled = data.resample(resample_rule).agg({
+                    'open': 'first',
+                    'high': 'max',
+                    'low': 'min',
+                    'close': 'last',
+                    'volume': 'sum'
+                })
+                
+                # Drop rows with NaN values
+                resampled = resampled.dropna()
             
             logger.info(f"Resampled data from {source_timeframe} to {target_timeframe}")
             logger.info(f"Original data: {len(data)} rows, Resampled data: {len(resampled)} rows")
@@ -101,6 +292,60 @@ class DataResampler:
             logger.error(f"Error resampling data: {e}", exc_info=True)
             return None
     
+    def resample_data_multi(
+        self,
+        data: pd.DataFrame,
+        source_timeframe: str,
+        target_timeframes: List[str]
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Resample data to several timeframes, scanning the source data only once.
+        
+        Each target is reduced from the coarsest already-computed timeframe that
+        divides it (e.g. 1h from 30m, 4h from 1h), so only the finest target reads
+        the full source data. OHLCV aggregation is associative and all buckets are
+        aligned to midnight, so the results match resampling each target directly.
+        
+        Args:
+            data: DataFrame with OHLCV data
+            source_timeframe: Source timeframe string (e.g., "1m")
+            target_timeframes: List of target timeframe strings
+            
+        Returns:
+            Dictionary mapping target timeframes to resampled DataFrames (or None if error)
+        """
+        if data is not None and data.index.name != 'time' and 'time' in data.columns:
+            data = data.set_index('time')
+            
+        valid = (
+            data is not None and len(data) > 0
+            and source_timeframe in _BUCKET_NS
+            and all(tf in _BUCKET_NS for tf in target_timeframes)
+            and _can_reduce_directly(data)
+        )
+        if not valid:
+            # Let resample_data handle validation, logging and the pandas fallback
+            return {tf: self.resample_data(data, source_timeframe, tf) for tf in target_timeframes}
+            
+        try:
+            # Resampled frames by bucket width, starting from the source data
+            computed = {_BUCKET_NS[source_timeframe]: data}
+            results = {}
+            
+            for tf in sorted(set(target_timeframes), key=_BUCKET_NS.get):
+                bucket_ns = _BUCKET_NS[tf]
+                base_ns = max(width for width in computed if bucket_ns % width == 0)
+                if base_ns != bucket_ns:
+                    computed[bucket_ns] = _reduce_ohlcv(computed[base_ns], bucket_ns)
+                results[tf] = computed[bucket_ns]
+                
+            logger.info(f"Resampled {len(data)} {source_timeframe} rows to {', '.join(results)}")
+            return {tf: results[tf] for tf in target_timeframes}
+            
+        except Exception as e:
+            logger.error(f"Error resampling data: {e}", exc_info=True)
+            return {tf: None for tf in target_timeframes}
+    
     def get_resampled_price_data(
         self,
         pair_name: str,
@@ -111,6 +356,11 @@ class DataResampler:
         """
         Get resampled price data for a currency pair.
         
+        Results are cached per (pair, timeframe, window) until this process writes
+        to the pair's 1m table (any insert, upsert or gap backfill), and for at
+        most resample_cache_ttl seconds, which bounds how long writes made by
+        other processes can go unnoticed.
+        
         Args:
             pair_name: Currency pair name
             target_timeframe: Target timeframe string
@@ -121,9 +371,28 @@ class DataResampler:
             Resampled DataFrame or None if error
         """
         try:
+            key = (
+                pair_name,
+                target_timeframe,
+                pd.Timestamp(start_date).value if start_date is not None else None,
+                pd.Timestamp(end_date).value if end_date is not None else None,
+            )
+            # Read before the data, so a write made while resampling invalidates the entry
+            version = self.data_manager.get_write_version(pair_name, "1m")
+            
+            with self._result_cache_lock:
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    cached_version, cached_at, cached_df = cached
+                    if cached_version == version and time.monotonic() - cached_at < self._result_cache_ttl:
+                        self._result_cache.move_to_end(key)
+                        # Copy so callers can't modify the cached frame
+                        return cached_df.copy()
+                    del self._result_cache[key]
+                    
             # Get the 1-minute data
-            m1_data = self.data_manager.get_price_data(pair_name, "1m", start_date, end_date)
-            if m1_data is None or m1_data.empty:
+            m1_data = self._get_m1_data(pair_name, start_date, end_date)
+            if m1_data is None:
                 logger.warning(f"No 1-minute data available for {pair_name}")
                 return None
                 
@@ -133,6 +402,12 @@ class DataResampler:
                 logger.error(f"Failed to resample data for {pair_name}")
                 return None
             
+            with self._result_cache_lock:
+                self._result_cache[key] = (version, time.monotonic(), resampled.copy())
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+            
             return resampled
             
         except Exception as e:
@@ -143,7 +418,8 @@ class DataResampler:
         self,
         pair_name: str,
         target_timeframes: List[str],
-        lookback_days: int = 30
+        lookback_days: int = 30,
+        end_date: Optional[datetime] = None
     ) -> Dict[str, bool]:
         """
         Resample the latest data for a currency pair to multiple timeframes.
@@ -152,6 +428,8 @@ class DataResampler:
             pair_name: Currency pair name
             target_timeframes: List of target timeframe strings
             lookback_days: Number of days to look back for data
+            end_date: End of the lookback window (defaults to now); batch callers
+                can compute it once and pass it for every pair
             
         Returns:
             Dictionary mapping timeframes to success status
@@ -160,29 +438,37 @@ class DataResampler:
         
         try:
             # Calculate the start date
-            end_date = pd.Timestamp.now()
-            start_date = end_date - pd.Timedelta(days=lookback_days)
+            if end_date is None:
+                end_date = datetime.now()
+            start_date = end_date - timedelta(days=lookback_days)
             
             # Get the raw 1-minute data
-            m1_data = self.data_manager.get_price_data(pair_name, "1m", start_date, end_date)
-            if m1_data is None or m1_data.empty:
+            m1_data = self._get_m1_data(pair_name, start_date, end_date)
+            if m1_data is None:
                 logger.warning(f"No 1-minute data available for {pair_name}")
                 return {tf: False for tf in target_timeframes}
                 
-            # Resample to each target timeframe
+            # No need to resample 1-minute data
+            pending = []
             for tf in target_timeframes:
                 if tf == "1m":
-                    # No need to resample 1-minute data
                     results[tf] = True
-                    continue
-                    
-                # Resample and store
-                resampled = self.resample_data(m1_data, "1m", tf)
+                else:
+                    pending.append(tf)
+            
+            # Resample to every target timeframe in one pass over the 1-minute data
+            resampled_frames = self.resample_data_multi(m1_data, "1m", pending)
+            
+            to_store = []
+            for tf, resampled in resampled_frames.items():
                 if resampled is not None:
-                    success = self.data_manager.store_price_data(pair_name, resampled, tf)
-                    results[tf] = success
+                    to_store.append((tf, resampled))
                 else:
                     results[tf] = False
+            
+            # Store all resampled timeframes in one transaction
+            if to_store:
+                results.update(self.data_manager.store_price_data_bulk(pair_name, to_store))
                     
             logger.info(f"Resampled latest data for {pair_name}: {results}")
             return results
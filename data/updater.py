@@ -2,21 +2,131 @@
 Data updater module for the Forex AI Trading system.
 Handles scheduled data updates, gap filling, and data integrity checks.
 """
+import atexit
+import os
+import numpy as np
 import pandas as pd
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set, Union
+from typing import Dict, List, Optional, Tuple
 import concurrent.futures
 
 from drl_forex_trading_internal.utils.logger import get_logger
 from drl_forex_trading_internal.utils.config import load_config
-from drl_forex_trading_internal.data.fetcher import MT5Fetcher
-from drl_forex_trading_internal.data.database import DataManager
+from drl_forex_trading_internal.data.fetcher import get_fetcher
+from drl_forex_trading_internal.data.database import get_data_manager
 from drl_forex_trading_internal.data.resampler import DataResampler
 
 # Create logger
 logger = get_logger("data.updater")
 
+# Gap fetch pool and MT5 in-flight cap shared by every updater in the process, created on first use
+_gap_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_mt5_inflight: Optional[threading.BoundedSemaphore] = None
+_GAP_EXECUTOR_LOCK = threading.Lock()
+
+def _get_gap_executor() -> concurrent.futures.ThreadPoolExecutor:
+	"""
+	Get the thread pool used to fetch gaps, creating it if needed.
+	
+	One pool serves all pairs and all updaters, so gap filling several pairs
+	at once doesn't start a separate set of threads per pair.
+	
+	Returns:
+		Shared ThreadPoolExecutor
+	"""
+	global _gap_executor
+	
+	with _GAP_EXECUTOR_LOCK:
+		if _gap_executor is None:
+			_gap_executor = concurrent.futures.ThreadPoolExecutor(
+				max_workers=load_config()["data"]["update"].get("gap_workers", 8),
+				thread_name_prefix="forex-gap"
+			)
+		return _gap_executor
+
+def _get_mt5_inflight() -> threading.BoundedSemaphore:
+	"""
+	Get the semaphore that caps MT5 requests in flight across all gap fetches.
+	
+	Returns:
+		Shared BoundedSemaphore
+	"""
+	global _mt5_inflight
+	
+	with _GAP_EXECUTOR_LOCK:
+		if _mt5_inflight is None:
+			_mt5_inflight = threading.BoundedSemaphore(load_config()["data"]["update"].get("mt5_inflight", 4))
+		return _mt5_inflight
+
+def shutdown_updaters() -> None:
+	"""Shutdown the shared gap fetch pool and MT5 connection."""
+	global _gap_executor
+	
+	with _GAP_EXECUTOR_LOCK:
+		if _gap_executor is not None:
+			_gap_executor.shutdown(wait=True)
+			_gap_executor = None
+	get_fetcher().shutdown()
+
+# Keep the MT5 connection open across update runs and close it once when the process exits
+atexit.register(shutdown_updaters)
+
+def _fuse_gaps(
+	gaps: List[Tuple[datetime, datetime]],
+	fuse_gap: timedelta,
+	max_gap: timedelta
+) -> List[Tuple[datetime, datetime]]:
+	"""
+	Merge gaps that are close together into wider fetch windows.
+	
+	Args:
+		gaps: (start, end) gaps sorted by start time
+		fuse_gap: Gaps starting less than this after the previous window ends are merged into it
+		max_gap: Longest window a merge may produce
+		
+	Returns:
+		List of (start, end) fetch windows, oldest first
+	"""
+	fused = []
+	for gap_start, gap_end in gaps:
+		if fused:
+			prev_start, prev_end = fused[-1]
+			if gap_start - prev_end < fuse_gap and max(gap_end, prev_end) - prev_start <= max_gap:
+				fused[-1] = (prev_start, max(gap_end, prev_end))
+				continue
+				
+		fused.append((gap_start, gap_end))
+	return fused
+
+# Per-process updater used by worker processes in update_all_pairs
+_process_updater: Optional["DataUpdater"] = None
+
+def _init_process_updater() -> None:
+	"""Create the worker process's own updater (MT5 and database connections are not shared across processes)."""
+	global _process_updater
+	
+	_process_updater = DataUpdater()
+
+def _update_pair_in_process(task: Tuple[str, bool, bool]) -> bool:
+	"""
+	Update a single currency pair inside a worker process.
+	
+	Args:
+		task: Tuple of (pair_name, update_latest, fill_gaps)
+		
+	Returns:
+		bool: True if all requested operations succeeded, False otherwise
+	"""
+	pair_name, update_latest, fill_gaps = task
+	
+	if not _process_updater.fetcher.is_initialized and not _process_updater.initialize():
+		logger.error(f"Failed to initialize MT5 connection in worker for {pair_name}")
+		return False
+		
+	return _process_updater._update_single_pair(pair_name, update_latest, fill_gaps)
+
 class DataUpdater:
 	"""
 	Class to handle data updates and gap filling.
@@ -27,10 +137,24 @@ class DataUpdater:
 		self.config = load_config()
 		self.data_config = self.config["data"]
 		self.update_config = self.data_config["update"]
-		self.fetcher = MT5Fetcher()
-		self.data_manager = DataManager()
-		self.resampler = DataResampler()
+		# Shared instances, so updaters created per run or per retry reuse warm connections
+		self.fetcher = get_fetcher()
+		self.data_manager = get_data_manager()
+		self.resampler = DataResampler(self.data_manager)
+		self.weekend_trading = self.config["calendar"].get("weekend_trading", False)
 		
+		# Parse market open/close hours once per weekday (first config entry per day wins)
+		self._open_hours = [0] * 7     # Default open at 00:00
+		self._close_hours = [22] * 7   # Default close at 22:00
+		seen_days = set()
+		for hours in self.config["calendar"].get("forex_market_open", []):
+			day = hours.get("day")
+			if day not in range(7) or day in seen_days:
+				continue
+			seen_days.add(day)
+			self._open_hours[day] = int(hours.get("time", "00:00").split(":")[0])
+			self._close_hours[day] = int(hours.get("time", "22:00").split(":")[0])
+			
 	def initialize(self) -> bool:
 		"""
 		Initialize the updater by connecting to MT5.
@@ -41,9 +165,9 @@ class DataUpdater:
 		return self.fetcher.initialize()
 		
 	def shutdown(self):
-		"""Shutdown MT5 connection."""
-		self.fetcher.shutdown()
-	
+		"""Shutdown MT5 connection and the gap fetch pool."""
+		shutdown_updaters()
+		
 	def update_latest_data(
 		self,
 		pair_name: str,
@@ -60,35 +184,16 @@ class DataUpdater:
 			bool: True if successful, False otherwise
 		"""
 		try:
-			# Fetch the latest data from MT5
+			# Fetch the latest data from MT5 as the raw rates array (no DataFrame round trip)
 			logger.info(f"Fetching the latest {last_n_candles} candles for {pair_name}...")
-			df = self.fetcher.fetch_ohlcv(pair_name, "M1", count=last_n_candles)
-			if df is None or len(df) == 0:
+			rates = self.fetcher.fetch_ohlcv_raw(pair_name, "M1", count=last_n_candles)
+			if rates is None or len(rates) == 0:
 				logger.error(f"Failed to fetch latest data for {pair_name}")
 				return False
-
-			current_minute = datetime.utcnow().replace(second=0, microsecond=0)
-			logger.info(f"Current minute: {current_minute}")
-			if df is not None and not df.empty:
-				logger.info(f"Data index range: {df.index.min()} to {df.index.max()}")
-				
-				# Convert index to same format for comparison
-				if df.index.tzinfo is not None:
-					current_minute = current_minute.replace(tzinfo=df.index.tzinfo)
-				
-				# Filter more explicitly
-				before_count = len(df)
-				df = df[df.index < current_minute]
-				after_count = len(df)
-				
-				if before_count > after_count:
-					logger.info(f"Filtered out {before_count - after_count} rows for current minute {current_minute}")
-				else:
-					logger.info(f"No current minute data found to filter (current: {current_minute})")
 				
 			# Store the data
-			logger.info(f"Storing {len(df)} latest candles for {pair_name}...")
-			success = self.data_manager.store_price_data(pair_name, df, timeframe="1m")
+			logger.info(f"Storing {len(rates)} latest candles for {pair_name}...")
+			success = self.data_manager.store_price_rates(pair_name, rates, timeframe="1m")
 			if not success:
 				logger.error(f"Failed to store latest data for {pair_name}")
 				return False
@@ -100,339 +205,60 @@ class DataUpdater:
 			logger.error(f"Error updating latest data for {pair_name}: {e}", exc_info=True)
 			return False
 	
-	def fill_data_gaps(
+	def update_latest_data_many(
 		self,
-		pair_name: str,
-		timeframe: str = "1m",
-		max_gap_days: int = 30
-	) -> bool:
-		"""
-		Find and fill gaps in the price data for a currency pair.
-		
-		Args:
-			pair_name: Currency pair name
-			timeframe: Timeframe string (should always be "1m")
-			max_gap_days: Maximum gap size in days to fill
-			
-		Returns:
-			bool: True if successful, False otherwise
-		"""
-		try:
-			# Only fill gaps for 1-minute data
-			if timeframe != "1m":
-				logger.info(f"Gap filling is only performed for 1-minute data, requested {timeframe}")
-				return False
-				
-			# Find gaps in the data
-			logger.info(f"Finding gaps in {timeframe} data for {pair_name}...")
-			gaps = self.data_manager.find_data_gaps(pair_name, timeframe)
-			
-			if not gaps:
-				logger.info(f"No gaps found in {timeframe} data for {pair_name}")
-				return True
-				
-			logger.info(f"Found {len(gaps)} gaps in {timeframe} data for {pair_name}")
-			
-			# Sort gaps by start time (oldest first)
-			gaps.sort(key=lambda x: x[0])
-			
-			# Track filled gaps
-			filled_gaps = 0
-			max_gap_timedelta = timedelta(days=max_gap_days)
-			
-			# Process each gap
-			for gap_start, gap_end in gaps:
-				# Skip gaps that are too large
-				gap_size = gap_end - gap_start
-				if gap_size > max_gap_timedelta:
-					logger.warning(f"Gap too large to fill: {gap_start} to {gap_end} ({gap_size.days} days)")
-					continue
-					
-				# # Skip weekend gaps if forex
-				# if self._is_weekend_gap(gap_start, gap_end):
-				# 	logger.info(f"Skipping weekend gap: {gap_start} to {gap_end}")
-				# 	continue
-					
-				# Fetch data for the gap
-				logger.info(f"Filling gap from {gap_start} to {gap_end}...")
-				gap_df = self.fetcher.fetch_ohlcv(pair_name, "M1", gap_start, gap_end)
-				
-				if gap_df is None or len(gap_df) == 0:
-					logger.warning(f"No data available for gap: {gap_start} to {gap_end}")
-					continue
-					
-				# Store the gap data
-				success = self.data_manager.store_price_data(pair_name, gap_df, timeframe)
-				if success:
-					filled_gaps += 1
-					logger.info(f"Successfully filled gap from {gap_start} to {gap_end} with {len(gap_df)} candles")
-				else:
-					logger.error(f"Failed to store gap data from {gap_start} to {gap_end}")
-			
-			logger.info(f"Gap filling complete. Filled {filled_gaps} out of {len(gaps)} gaps.")
-			return True
-			
-		except Exception as e:
-			logger.error(f"Error filling gaps for {pair_name}: {e}", exc_info=True)
-			return False
-	
-	def _is_weekend_gap(self, start: datetime, end: datetime) -> bool:
-		"""
-		Check if a gap is during the weekend (for forex markets).
-		
-		Args:
-			start: Gap start time
-			end: Gap end time
-			
-		Returns:
-			True if the gap is during the weekend, False otherwise
-		"""
-		# Check if forex markets are closed on weekends according to config
-		if not self.config["calendar"].get("weekend_trading", False):
-			# If end time is Monday and start time is Friday, might be weekend
-			if end.weekday() == 0 and start.weekday() == 4:
-				# Check if gap starts on Friday after market close
-				friday_close = self._get_market_close_time(4)  # 4 = Friday
-				
-				# Check if gap ends on Monday after market open
-				monday_open = self._get_market_open_time(0)    # 0 = Monday
-				
-				if start.hour >= friday_close and end.hour <= monday_open:
-					return True
-					
-		return False
-	
-	def _get_market_close_time(self, day: int) -> int:
-		"""
-		Get market close time for a specific day from config.
-		
-		Args:
-			day: Day of week (0 = Monday, 6 = Sunday)
-			
-		Returns:
-			Hour of market close (default 22 for forex)
-		"""
-		market_hours = self.config["calendar"].get("forex_market_open", [])
-		for hours in market_hours:
-			if hours.get("day") == day:
-				time_str = hours.get("time", "22:00")
-				return int(time_str.split(":")[0])
-				
-		return 22  # Default close at 22:00
-	
-	def _get_market_open_time(self, day: int) -> int:
-		"""
-		Get market open time for a specific day from config.
-		
-		Args:
-			day: Day of week (0 = Monday, 6 = Sunday)
-			
-		Returns:
-			Hour of market open (default 0 for forex)
-		"""
-		market_hours = self.config["calendar"].get("forex_market_open", [])
-		for hours in market_hours:
-			if hours.get("day") == day:
-				time_str = hours.get("time", "00:00")
-				return int(time_str.split(":")[0])
-				
-		return 0  # Default open at 00:00
-	
-	def update_all_pairs(
-		self,
-		update_latest: bool = True,
-		fill_gaps: bool = True,
-		max_workers: int = 4
+		pair_names: List[str],
+		last_n_candles: int = 1000
 	) -> Dict[str, bool]:
 		"""
-		Update all configured currency pairs.
+		Update the latest data for several currency pairs at once.
+		
+		All pairs are fetched concurrently and stored in a single transaction.
 		
 		Args:
-			update_latest: Whether to update the latest data
-			fill_gaps: Whether to fill gaps in historical data
-			max_workers: Maximum number of parallel workers
+			pair_names: Currency pair names
+			last_n_candles: Number of latest candles to fetch per pair
 			
 		Returns:
 			Dictionary mapping pair names to success status
 		"""
-		results = {}
+		results = {pair_name: False for pair_name in pair_names}
 		
 		try:
-			# Ensure we have a connection to MT5
-			if not self.fetcher.is_initialized and not self.initialize():
-				logger.error("Failed to initialize MT5 connection")
-				return {}
-				
-			# Ensure currency pairs exist in the database
-			pair_map = self.data_manager.ensure_currency_pairs()
-			if not pair_map:
-				logger.error("No currency pairs found in configuration")
-				return {}
-				
-			# Update pairs in parallel
-			with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-				future_to_pair = {}
+			# Fetch the latest data from MT5
+			logger.info(f"Fetching the latest {last_n_candles} candles for {len(pair_names)} pairs...")
+			fetched = self.fetcher.fetch_ohlcv_many([
+				{"symbol": pair_name, "timeframe": "M1", "count": last_n_candles}
+				for pair_name in pair_names
+			])
+			
+			datasets = {}
+			for pair_name in pair_names:
+				df = fetched.get((pair_name, "M1"))
+				if df is None or len(df) == 0:
+					logger.error("Failed to fetch latest data for %s", pair_name)
+					continue
+					
+				datasets[pair_name] = df
 				
-				for pair_name in pair_map.keys():
-					future = executor.submit(
-						self._update_single_pair,
-						pair_name,
-						update_latest,
-						fill_gaps
-					)
-					future_to_pair[future] = pair_name
+			if not datasets:
+				return results
 				
-				for future in concurrent.futures.as_completed(future_to_pair):
-					pair_name = future_to_pair[future]
-					try:
-						result = future.result()
-						results[pair_name] = result
-					except Exception as e:
-						logger.error(f"Error updating {pair_name}: {e}", exc_info=True)
-						results[pair_name] = False
+			# Store the data
+			logger.info(f"Storing latest candles for {len(datasets)} pairs...")
+			results.update(self.data_manager.store_price_data_many(datasets, timeframe="1m"))
 			
-			logger.info(f"Completed update for all pairs: {results}")
-			return results
+			for pair_name, success in results.items():
+				if success:
+					logger.info("Successfully updated latest data for %s", pair_name)
+				else:
+					logger.error("Failed to update latest data for %s", pair_name)
 			
-		except Exception as e:
-			logger.error(f"Error updating all pairs: {e}", exc_info=True)
 			return results
-		
-		finally:
-			# Always shut down MT5 when done
-			self.shutdown()
-	
-	def _update_single_pair(
-		self,
-		pair_name: str,
-		update_latest: bool,
-		fill_gaps: bool
-	) -> bool:
-		"""
-		Update a single currency pair.
-		
-		Args:
-			pair_name: Currency pair name
-			update_latest: Whether to update the latest data
-			fill_gaps: Whether to fill gaps in historical data
-			
-		Returns:
-			bool: True if all requested operations succeeded, False otherwise
-		"""
-		success = True
-		
-		try:
-			logger.info(f"Starting update for {pair_name}...")
-			
-			# Update latest data if requested
-			if update_latest:
-				logger.info(f"Updating latest data for {pair_name}...")
-				latest_success = self.update_latest_data(
-					pair_name,
-					last_n_candles=self.update_config.get("max_candles_per_request", 1000)
-				)
-				success = success and latest_success
-			
-			# Fill gaps if requested
-			if fill_gaps:
-				logger.info(f"Filling gaps for {pair_name}...")
-				gaps_success = self.fill_data_gaps(
-					pair_name,
-					timeframe="1m",
-					max_gap_days=30
-				)
-				success = success and gaps_success
-			
-			logger.info(f"Completed update for {pair_name}: {'Success' if success else 'Failure'}")
-			return success
 			
 		except Exception as e:
-			logger.error(f"Error in _update_single_pair for {pair_name}: {e}", exc_info=True)
-			return False
-	
-
-	"""
-Data updater module for the Forex AI Trading system.
-Handles scheduled data updates, gap filling, and data integrity checks.
-"""
-import pandas as pd
-import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set, Union
-import concurrent.futures
-
-from drl_forex_trading_internal.utils.logger import get_logger
-from drl_forex_trading_internal.utils.config import load_config
-from drl_forex_trading_internal.data.fetcher import MT5Fetcher
-from drl_forex_trading_internal.data.database import DataManager
-from drl_forex_trading_internal.data.resampler import DataResampler
-
-# Create logger
-logger = get_logger("data.updater")
-
-class DataUpdater:
-	"""
-	Class to handle data updates and gap filling.
-	"""
-	
-	def __init__(self):
-		"""Initialize the data updater."""
-		self.config = load_config()
-		self.data_config = self.config["data"]
-		self.update_config = self.data_config["update"]
-		self.fetcher = MT5Fetcher()
-		self.data_manager = DataManager()
-		self.resampler = DataResampler()
-		
-	def initialize(self) -> bool:
-		"""
-		Initialize the updater by connecting to MT5.
-		
-		Returns:
-			bool: True if successful, False otherwise
-		"""
-		return self.fetcher.initialize()
-		
-	def shutdown(self):
-		"""Shutdown MT5 connection."""
-		self.fetcher.shutdown()
-	
-	def update_latest_data(
-		self,
-		pair_name: str,
-		last_n_candles: int = 1000
-	) -> bool:
-		"""
-		Update the latest data for a currency pair.
-		
-		Args:
-			pair_name: Currency pair name
-			last_n_candles: Number of latest candles to fetch
-			
-		Returns:
-			bool: True if successful, False otherwise
-		"""
-		try:
-			# Fetch the latest data from MT5
-			logger.info(f"Fetching the latest {last_n_candles} candles for {pair_name}...")
-			df = self.fetcher.fetch_ohlcv(pair_name, "M1", count=last_n_candles)
-			if df is None or len(df) == 0:
-				logger.error(f"Failed to fetch latest data for {pair_name}")
-				return False
-				
-			# Store the data
-			logger.info(f"Storing {len(df)} latest candles for {pair_name}...")
-			success = self.data_manager.store_price_data(pair_name, df, timeframe="1m")
-			if not success:
-				logger.error(f"Failed to store latest data for {pair_name}")
-				return False
-			
-			logger.info(f"Successfully updated latest data for {pair_name}")
-			return True
-			
-		except Exception as e:
-			logger.error(f"Error updating latest data for {pair_name}: {e}", exc_info=True)
-			return False
+			logger.error(f"Error updating latest data for {pair_names}: {e}", exc_info=True)
+			return results
 	
 	def fill_data_gaps(
 		self,
@@ -467,41 +293,105 @@ class DataUpdater:
 				
 			logger.info(f"Found {len(gaps)} gaps in {timeframe} data for {pair_name}")
 			
-			# Sort gaps by start time (oldest first)
-			gaps.sort(key=lambda x: x[0])
-			
 			# Track filled gaps
 			filled_gaps = 0
-			max_gap_timedelta = timedelta(days=max_gap_days)
-			
-			# Process each gap
-			for gap_start, gap_end in gaps:
-				# Skip gaps that are too large
-				gap_size = gap_end - gap_start
-				if gap_size > max_gap_timedelta:
-					logger.warning(f"Gap too large to fill: {gap_start} to {gap_end} ({gap_size.days} days)")
+			
+			# Compute gap sizes and the start-time order on datetime64 arrays
+			bounds = np.array(gaps, dtype="datetime64[ns]")
+			sizes = bounds[:, 1] - bounds[:, 0]
+			too_large = sizes > np.timedelta64(max_gap_days, "D")
+			weekend = self._weekend_gap_mask(bounds)
+			
+			# Skip gaps that are too large
+			for i in np.flatnonzero(too_large):
+				gap_start, gap_end = gaps[i]
+				logger.warning("Gap too large to fill: %s to %s (%d days)", gap_start, gap_end, (gap_end - gap_start).days)
+			
+			# Select the gaps worth fetching, oldest first
+			selected_gaps = []
+			for i in np.argsort(bounds[:, 0], kind="stable"):
+				if too_large[i]:
 					continue
 					
+				gap_start, gap_end = gaps[i]
+				
 				# Skip weekend gaps if forex
-				if self._is_weekend_gap(gap_start, gap_end):
-					logger.info(f"Skipping weekend gap: {gap_start} to {gap_end}")
+				if weekend[i]:
+					logger.info("Skipping weekend gap: %s to %s", gap_start, gap_end)
 					continue
 					
-				# Fetch data for the gap
-				logger.info(f"Filling gap from {gap_start} to {gap_end}...")
-				gap_df = self.fetcher.fetch_ohlcv(pair_name, "M1", gap_start, gap_end)
+				selected_gaps.append((gap_start, gap_end))
+			
+			# Fuse gaps that are close together into one wider fetch
+			fillable_gaps = _fuse_gaps(
+				selected_gaps,
+				timedelta(minutes=self.update_config.get("gap_fuse_minutes", 5)),
+				timedelta(days=max_gap_days)
+			)
+			
+			if not fillable_gaps:
+				logger.info(f"Gap filling complete. Filled 0 out of {len(gaps)} gaps.")
+				return True
+			
+			# Fetch gaps in parallel, then store them together in one load
+			gap_frames = []
+			executor = _get_gap_executor()
+			mt5_inflight = _get_mt5_inflight()
+			future_to_gap = {}
+			
+			for gap_start, gap_end in fillable_gaps:
+				logger.info("Filling gap from %s to %s...", gap_start, gap_end)
+				
+				# Wait for a slot so only a bounded number of MT5 requests are outstanding
+				mt5_inflight.acquire()
+				try:
+					future = executor.submit(
+						self.fetcher.fetch_ohlcv,
+						pair_name,
+						"M1",
+						gap_start,
+						gap_end
+					)
+				except Exception:
+					mt5_inflight.release()
+					raise
+				future.add_done_callback(lambda _: mt5_inflight.release())
+				future_to_gap[future] = (gap_start, gap_end)
+			
+			for future in concurrent.futures.as_completed(future_to_gap):
+				gap_start, gap_end = future_to_gap[future]
+				try:
+					gap_df = future.result()
+				except Exception as e:
+					logger.error("Error fetching gap from %s to %s: %s", gap_start, gap_end, e, exc_info=True)
+					continue
 				
 				if gap_df is None or len(gap_df) == 0:
-					logger.warning(f"No data available for gap: {gap_start} to {gap_end}")
+					logger.warning("No data available for gap: %s to %s", gap_start, gap_end)
 					continue
 					
-				# Store the gap data
-				success = self.data_manager.store_price_data(pair_name, gap_df, timeframe)
+				gap_frames.append(gap_df)
+				logger.info("Fetched %d candles for gap from %s to %s", len(gap_df), gap_start, gap_end)
+			
+			if gap_frames:
+				# Stage through COPY and merge with ON CONFLICT, since
+				# fetched gap ranges usually overlap rows that are already stored
+				gap_data = pd.concat(gap_frames)
+				
+				# Index maintenance dominates very large loads, so rebuild the indexes afterwards instead
+				dropped_indexes = []
+				if len(gap_data) > self.update_config.get("index_rebuild_rows", 500000):
+					dropped_indexes = self.data_manager.drop_secondary_indexes(pair_name, timeframe)
+				try:
+					success = self.data_manager.store_price_data(pair_name, gap_data, timeframe, use_copy=True)
+				finally:
+					self.data_manager.recreate_indexes(pair_name, dropped_indexes, parallel=True)
+					
 				if success:
-					filled_gaps += 1
-					logger.info(f"Successfully filled gap from {gap_start} to {gap_end} with {len(gap_df)} candles")
+					filled_gaps = len(gap_frames)
+					logger.info(f"Successfully stored {len(gap_data)} candles for {filled_gaps} (fused) gaps")
 				else:
-					logger.error(f"Failed to store gap data from {gap_start} to {gap_end}")
+					logger.error(f"Failed to store gap data for {pair_name}")
 			
 			logger.info(f"Gap filling complete. Filled {filled_gaps} out of {len(gaps)} gaps.")
 			return True
@@ -522,7 +412,7 @@ class DataUpdater:
 			True if the gap is during the weekend, False otherwise
 		"""
 		# Check if forex markets are closed on weekends according to config
-		if not self.config["calendar"].get("weekend_trading", False):
+		if not self.weekend_trading:
 			# If end time is Monday and start time is Friday, might be weekend
 			if end.weekday() == 0 and start.weekday() == 4:
 				# Check if gap starts on Friday after market close
@@ -536,6 +426,32 @@ class DataUpdater:
 					
 		return False
 	
+	def _weekend_gap_mask(self, bounds: np.ndarray) -> np.ndarray:
+		"""
+		Vectorized version of _is_weekend_gap for many gaps at once.
+		
+		Args:
+			bounds: datetime64 array of shape (n, 2) holding gap start and end times
+			
+		Returns:
+			Boolean array, True where the gap is during the weekend
+		"""
+		if self.weekend_trading:
+			return np.zeros(len(bounds), dtype=bool)
+			
+		seconds = bounds.astype("datetime64[s]").astype(np.int64)
+		
+		# 1970-01-01 was a Thursday, so Monday = 0 matches datetime.weekday()
+		weekdays = (seconds // 86400 + 3) % 7
+		hours = (seconds % 86400) // 3600
+		
+		return (
+			(weekdays[:, 0] == 4) &
+			(weekdays[:, 1] == 0) &
+			(hours[:, 0] >= self._get_market_close_time(4)) &
+			(hours[:, 1] <= self._get_market_open_time(0))
+		)
+	
 	def _get_market_close_time(self, day: int) -> int:
 		"""
 		Get market close time for a specific day from config.
@@ -546,13 +462,7 @@ class DataUpdater:
 		Returns:
 			Hour of market close (default 22 for forex)
 		"""
-		market_hours = self.config["calendar"].get("forex_market_open", [])
-		for hours in market_hours:
-			if hours.get("day") == day:
-				time_str = hours.get("time", "22:00")
-				return int(time_str.split(":")[0])
-				
-		return 22  # Default close at 22:00
+		return self._close_hours[day]
 	
 	def _get_market_open_time(self, day: int) -> int:
 		"""
@@ -564,19 +474,14 @@ class DataUpdater:
 		Returns:
 			Hour of market open (default 0 for forex)
 		"""
-		market_hours = self.config["calendar"].get("forex_market_open", [])
-		for hours in market_hours:
-			if hours.get("day") == day:
-				time_str = hours.get("time", "00:00")
-				return int(time_str.split(":")[0])
-				
-		return 0  # Default open at 00:00
+		return self._open_hours[day]
 	
 	def update_all_pairs(
 		self,
 		update_latest: bool = True,
 		fill_gaps: bool = True,
-		max_workers: int = 4
+		max_workers: int = 4,
+		use_processes: bool = False
 	) -> Dict[str, bool]:
 		"""
 		Update all configured currency pairs.
@@ -585,6 +490,8 @@ class DataUpdater:
 			update_latest: Whether to update the latest data
 			fill_gaps: Whether to fill gaps in historical data
 			max_workers: Maximum number of parallel workers
+			use_processes: Whether to update pairs in worker processes instead of threads,
+				so the pandas and database serialization work is not bound by the GIL
 			
 		Returns:
 			Dictionary mapping pair names to success status
@@ -603,27 +510,70 @@ class DataUpdater:
 				logger.error("No currency pairs found in configuration")
 				return {}
 				
-			# Update pairs in parallel
-			with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-				future_to_pair = {}
+			if use_processes:
+				# Each worker process opens its own MT5 and database connections
+				pair_names = list(pair_map.keys())
+				tasks = [(pair_name, update_latest, fill_gaps) for pair_name in pair_names]
+				chunksize = max(1, len(tasks) // (max_workers * 4))
 				
-				for pair_name in pair_map.keys():
-					future = executor.submit(
-						self._update_single_pair,
-						pair_name,
-						update_latest,
-						fill_gaps
-					)
-					future_to_pair[future] = pair_name
+				with concurrent.futures.ProcessPoolExecutor(
+					max_workers=max_workers,
+					initializer=_init_process_updater
+				) as executor:
+					results = dict(zip(pair_names, executor.map(_update_pair_in_process, tasks, chunksize=chunksize)))
+					
+				logger.info(f"Completed update for all pairs: {results}")
+				return results
 				
-				for future in concurrent.futures.as_completed(future_to_pair):
-					pair_name = future_to_pair[future]
-					try:
-						result = future.result()
-						results[pair_name] = result
-					except Exception as e:
-						logger.error(f"Error updating {pair_name}: {e}", exc_info=True)
-						results[pair_name] = False
+			# Update the latest data for all pairs with one fetch batch and one store
+			latest_results = {}
+			if update_latest:
+				latest_results = self.update_latest_data_many(
+					list(pair_map.keys()),
+					last_n_candles=self.update_config.get("max_candles_per_request", 1000)
+				)
+				
+			pair_names = list(pair_map.keys())
+			
+			if update_latest and fill_gaps:
+				# Gap filling would hit the same MT5/database failure, so skip pairs whose latest update failed
+				failed_pairs = [pair_name for pair_name in pair_names if latest_results.get(pair_name) is False]
+				results.update(dict.fromkeys(failed_pairs, False))
+				pair_names = [pair_name for pair_name in pair_names if pair_name not in results]
+				
+			if not fill_gaps:
+				# Nothing is left to do per pair
+				results = {pair_name: latest_results.get(pair_name, not update_latest) for pair_name in pair_names}
+				
+			elif len(pair_names) <= self.update_config.get("thread_threshold", 2) or max_workers <= 1:
+				# With only a couple of pairs the pool costs more than it overlaps
+				for pair_name in pair_names:
+					result = self._update_single_pair(pair_name, False, fill_gaps)
+					results[pair_name] = result and latest_results.get(pair_name, not update_latest)
+					
+			else:
+				# Update pairs in parallel; the work is I/O-bound, but more threads than this only oversubscribe
+				workers = min(max_workers, len(pair_names), (os.cpu_count() or 1) * 4)
+				with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="forex-upd") as executor:
+					future_to_pair = {}
+					
+					for pair_name in pair_names:
+						future = executor.submit(
+							self._update_single_pair,
+							pair_name,
+							False,
+							fill_gaps
+						)
+						future_to_pair[future] = pair_name
+					
+					for future in concurrent.futures.as_completed(future_to_pair):
+						pair_name = future_to_pair[future]
+						try:
+							result = future.result()
+							results[pair_name] = result and latest_results.get(pair_name, not update_latest)
+						except Exception as e:
+							logger.error(f"Error updating {pair_name}: {e}", exc_info=True)
+							results[pair_name] = False
 			
 			logger.info(f"Completed update for all pairs: {results}")
 			return results
@@ -631,10 +581,6 @@ class DataUpdater:
 		except Exception as e:
 			logger.error(f"Error updating all pairs: {e}", exc_info=True)
 			return results
-		
-		finally:
-			# Always shut down MT5 when done
-			self.shutdown()
 	
 	def _update_single_pair(
 		self,
@@ -653,32 +599,35 @@ class DataUpdater:
 		Returns:
 			bool: True if all requested operations succeeded, False otherwise
 		"""
-		success = True
-		
 		try:
-			logger.info(f"Starting update for {pair_name}...")
+			logger.info("Starting update for %s...", pair_name)
 			
 			# Update latest data if requested
 			if update_latest:
-				logger.info(f"Updating latest data for {pair_name}...")
+				logger.info("Updating latest data for %s...", pair_name)
 				latest_success = self.update_latest_data(
 					pair_name,
 					last_n_candles=self.update_config.get("max_candles_per_request", 1000)
 				)
-				success = success and latest_success
+				if not latest_success:
+					# Gap filling would hit the same MT5/database failure, so stop here
+					logger.info("Completed update for %s: Failure", pair_name)
+					return False
 			
 			# Fill gaps if requested
 			if fill_gaps:
-				logger.info(f"Filling gaps for {pair_name}...")
+				logger.info("Filling gaps for %s...", pair_name)
 				gaps_success = self.fill_data_gaps(
 					pair_name,
 					timeframe="1m",
 					max_gap_days=30
 				)
-				success = success and gaps_success
+				if not gaps_success:
+					logger.info("Completed update for %s: Failure", pair_name)
+					return False
 			
-			logger.info(f"Completed update for {pair_name}: {'Success' if success else 'Failure'}")
-			return success
+			logger.info("Completed update for %s: Success", pair_name)
+			return True
 			
 		except Exception as e:
 			logger.error(f"Error in _update_single_pair for {pair_name}: {e}", exc_info=True)
@@ -734,4 +683,3 @@ class DataUpdater:
 			
 		except Exception as e:
 			logger.error(f"Critical error in scheduled update: {e}", exc_info=True)
-			
\ No newline at end of file
@@ -2,6 +2,7 @@
 Database connector for the Forex AI Trading system.
 Handles connections to PostgreSQL using SQLAlchemy.
 """
+import atexit
 from typing import Optional
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
@@ -21,15 +22,18 @@ logger = get_logger("db.connector")
 _engine: Optional[Engine] = None
 _SessionFactory = None
 
-def get_connection_string() -> str:
+def get_connection_string(db_config: Optional[dict] = None) -> str:
     """
     Get the PostgreSQL connection string from config.
     
+    Args:
+        db_config: Database configuration section (loaded from config if None)
+        
     Returns:
         PostgreSQL connection string
     """
-    config = load_config()
-    db_config = config["database"]
+    if db_config is None:
+        db_config = load_config()["database"]
     
     return (
         f"postgresql://{db_config['user']}:{db_config['password']}@"
@@ -50,7 +54,7 @@ def get_engine() -> Engine:
         config = load_config()
         db_config = config["database"]
         
-        conn_str = get_connection_string()
+        conn_str = get_connection_string(db_config)
         
         # Create engine with connection pooling
         _engine = create_engine(
@@ -59,10 +63,17 @@ def get_engine() -> Engine:
             pool_size=db_config.get("pool_size", 5),
             max_overflow=db_config.get("max_overflow", 10),
             pool_pre_ping=True,  # Check connection validity before using
+            pool_use_lifo=True,  # Reuse the most recent connection so its backend caches stay warm
             pool_recycle=3600,  # Recycle connections after 1 hour
+            executemany_mode="values_plus_batch",  # Multi-row VALUES for inserts, execute_batch for other bulk executes
+            executemany_batch_page_size=500,  # Statements per round trip for other bulk executes
+            query_cache_size=1200,  # Room for every per-pair, per-timeframe statement without eviction
         )
         
         logger.info(f"Created database engine for {db_config['name']} on {db_config['host']}")
+        
+        # The engine lives for the whole process; its pool is only disposed at exit
+        atexit.register(close_db_connections)
     
     return _engine
 
@@ -1,9 +1,10 @@
 """
 All database models for the Forex AI Trading system.
 """
-import datetime
-from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean, JSON, ForeignKey, UniqueConstraint, Index, MetaData, Table
+from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean, ForeignKey, UniqueConstraint, Index, MetaData
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql import func
 
 # Create base metadata with naming convention
 naming_convention = {
@@ -16,6 +17,18 @@ naming_convention = {
 metadata = MetaData(naming_convention=naming_convention)
 Base = declarative_base(metadata=metadata)
 
+def _utcnow():
+    """
+    SQL expression for the current UTC time, evaluated by the database.
+    
+    Used instead of datetime.utcnow so bulk inserts don't need a Python call
+    (and a separate parameter) per row.
+    
+    Returns:
+        SQLAlchemy expression
+    """
+    return func.timezone('utc', func.now())
+
 class CurrencyPair(Base):
     """Currency pair information."""
     __tablename__ = 'currency_pairs'
@@ -26,9 +39,9 @@ class CurrencyPair(Base):
     description = Column(String(100))
     pip_value = Column(Float, nullable=False)
     spread_avg = Column(Float)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, 
-                       onupdate=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=_utcnow(), server_default=_utcnow())
+    updated_at = Column(DateTime, default=_utcnow(), server_default=_utcnow(),
+                       onupdate=_utcnow())
     
     def __repr__(self):
         return f"<CurrencyPair(name='{self.name}')>"
@@ -51,17 +64,17 @@ class ModelInfo(Base):
     # Training information
     training_start_date = Column(DateTime, nullable=False)
     training_end_date = Column(DateTime, nullable=False)
-    currency_pairs = Column(JSON, nullable=False)  # List of currency pairs used for training
-    timeframes = Column(JSON, nullable=False)  # List of timeframes used
-    features = Column(JSON, nullable=False)  # List of features used for training
+    currency_pairs = Column(JSONB, nullable=False)  # List of currency pairs used for training
+    timeframes = Column(JSONB, nullable=False)  # List of timeframes used
+    features = Column(JSONB, nullable=False)  # List of features used for training
     
     # Hyperparameters and configuration
-    hyperparameters = Column(JSON, nullable=False)  # Model hyperparameters
-    metrics = Column(JSON)  # Performance metrics
+    hyperparameters = Column(JSONB, nullable=False)  # Model hyperparameters
+    metrics = Column(JSONB)  # Performance metrics
     
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, 
-                       onupdate=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=_utcnow(), server_default=_utcnow())
+    updated_at = Column(DateTime, default=_utcnow(), server_default=_utcnow(),
+                       onupdate=_utcnow())
     
     def __repr__(self):
         return f"<ModelInfo(name='{self.name}', version='{self.version}')>"
@@ -69,7 +82,11 @@ class ModelInfo(Base):
 class Strategy(Base):
     """Trading strategy information."""
     __tablename__ = 'strategies'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # JSONB containment/key filters on indicators can use this index
+        Index('ix_strategies_indicators_gin', 'indicators', postgresql_using='gin'),
+        {'extend_existing': True}
+    )
     
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, unique=True)
@@ -77,14 +94,14 @@ class Strategy(Base):
     is_active = Column(Boolean, default=False)
     
     # Components and configuration
-    model_ids = Column(JSON)  # IDs of models used in this strategy
-    indicators = Column(JSON)  # List of indicators with parameters
-    rules = Column(JSON)  # Strategy rules
-    parameters = Column(JSON)  # Additional strategy parameters
+    model_ids = Column(JSONB)  # IDs of models used in this strategy
+    indicators = Column(JSONB)  # List of indicators with parameters
+    rules = Column(JSONB)  # Strategy rules
+    parameters = Column(JSONB)  # Additional strategy parameters
     
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, 
-                       onupdate=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=_utcnow(), server_default=_utcnow())
+    updated_at = Column(DateTime, default=_utcnow(), server_default=_utcnow(),
+                       onupdate=_utcnow())
     
     def __repr__(self):
         return f"<Strategy(name='{self.name}')>"
@@ -118,12 +135,12 @@ class Trade(Base):
     
     # Additional information
     timeframe = Column(String(10), nullable=False)  # e.g., 'M1', 'H1'
-    signals = Column(JSON)  # Signals that triggered this trade
+    signals = Column(JSONB)  # Signals that triggered this trade
     notes = Column(String(500))
     
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, 
-                       onupdate=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=_utcnow(), server_default=_utcnow())
+    updated_at = Column(DateTime, default=_utcnow(), server_default=_utcnow(),
+                       onupdate=_utcnow())
     
     def __repr__(self):
         return f"<Trade(id={self.id}, pair='{self.currency_pair_id}')>"
\ No newline at end of file
@@ -1,8 +1,20 @@
 """
 Database schema utilities for the Forex AI Trading system.
 """
-import sqlalchemy
-from sqlalchemy import Table, Column, DateTime, Float, MetaData, Index
+import threading
+from typing import Dict, Tuple
+
+from sqlalchemy import Table, Column, DateTime, Float, REAL, MetaData, Index, text
+
+from drl_forex_trading_internal.utils.logger import get_logger
+
+# Create logger
+logger = get_logger("db.schema")
+
+# The process-wide price table cache, keyed by (PAIR, timeframe); DataManager goes through it too
+_TABLE_CACHE: Dict[Tuple[str, str], Table] = {}
+_TABLE_CACHE_LOCK = threading.Lock()
+_METADATA = MetaData(schema='price_data')
 
 def create_price_table(engine, pair_name, timeframe="1m"):
     """
@@ -13,32 +25,117 @@ def create_price_table(engine, pair_name, timeframe="1m"):
         pair_name: Currency pair name (e.g., 'EURUSD')
         timeframe: Timeframe (e.g., '1m', '5m', '1h')
     """
-    metadata = MetaData(schema='price_data')
+    key = (pair_name.upper(), timeframe)
+    table = _TABLE_CACHE.get(key)
+    if table is not None:
+        return table
+        
+    with _TABLE_CACHE_LOCK:
+        table = _TABLE_CACHE.get(key)
+        if table is None:
+            table = _create_price_table(engine, pair_name, timeframe)
+            _TABLE_CACHE[key] = table
+            
+    return table
+
+def _price_table_elements(table_name, column_types=None):
+    """
+    Build the columns and indexes of a price table.
+    
+    Column objects belong to a single Table, so fresh ones are built per table.
+    
+    Args:
+        table_name: Table name (e.g., 'eurusd_1m')
+        column_types: Stored data type per column name, as listed in the catalog,
+            for a table that already exists (None for a new table)
+        
+    Returns:
+        List of Column and Index objects
+    """
+    if column_types is None:
+        column_types = {}
+        
+    def value_type(column_name, default):
+        # Declare what the database actually stores, so reads are decoded correctly
+        stored = column_types.get(column_name)
+        if stored == 'real':
+            return REAL
+        if stored == 'double precision':
+            return Float
+        return default
+        
+    return [
+        Column('timestamp', DateTime, primary_key=True),
+        # New tables use double precision; tables created with REAL prices keep them,
+        # and DataManager.get_price_data strips the float32 noise from those on read
+        Column('open', value_type('open', Float), nullable=False),
+        Column('high', value_type('high', Float), nullable=False),
+        Column('low', value_type('low', Float), nullable=False),
+        Column('close', value_type('close', Float), nullable=False),
+        Column('volume', value_type('volume', Float), nullable=False),
+        # The primary key already provides the btree on timestamp; candles are appended
+        # in time order, so a BRIN index adds cheap range scans at a fraction of the size
+        Index(
+            f'brin_{table_name}_timestamp', 'timestamp',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        )
+    ]
+
+def _get_known_tables(engine) -> Dict[str, Dict[str, str]]:
+    """
+    Get the existing price tables and their column types, listing them once per engine.
+    
+    Args:
+        engine: SQLAlchemy engine
+        
+    Returns:
+        Dictionary mapping table names in the price_data schema to their
+        {column name: data type} (updated as tables are created)
+    """
+    known = engine.info.get('price_data_tables')
+    if known is None:
+        known = {}
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT table_name, column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = 'price_data'"
+            ))
+            for table_name, column_name, data_type in rows:
+                known.setdefault(table_name, {})[column_name] = data_type
+        engine.info['price_data_tables'] = known
+    return known
+
+def _create_price_table(engine, pair_name, timeframe):
+    """
+    Define a price table in the shared metadata, creating it in the database if needed.
+    
+    Args:
+        engine: SQLAlchemy engine
+        pair_name: Currency pair name (e.g., 'EURUSD')
+        timeframe: Timeframe (e.g., '1m', '5m', '1h')
+        
+    Returns:
+        SQLAlchemy Table object
+    """
+    metadata = _METADATA
     
     # Convert pair name to lowercase for table naming
     table_name = f"{pair_name.lower()}_{timeframe}"
     
-    # Check if table already exists
-    insp = sqlalchemy.inspect(engine)
-    if insp.has_table(table_name, schema='price_data'):
-        # Table exists, get it from metadata
-        metadata.reflect(bind=engine, schema='price_data', only=[table_name])
-        return metadata.tables[f'price_data.{table_name}']
-    
-    # Create table
-    table = Table(
-        table_name, 
-        metadata,
-        Column('timestamp', DateTime, primary_key=True),
-        Column('open', Float, nullable=False),
-        Column('high', Float, nullable=False),
-        Column('low', Float, nullable=False),
-        Column('close', Float, nullable=False),
-        Column('volume', Float, nullable=False),
-        Index(f'ix_{table_name}_timestamp', 'timestamp')
-    )
-    
-    # Create table in the database
-    metadata.create_all(engine)
-    
-    return table
\ No newline at end of file
+    # The layout is fixed, so existing tables are defined locally instead of reflected;
+    # only the value column types, which older tables store differently, come from the catalog
+    known_tables = _get_known_tables(engine)
+    column_types = known_tables.get(table_name)
+    table = Table(table_name, metadata, *_price_table_elements(table_name, column_types))
+    
+    if column_types is None:
+        # Create table in the database
+        logger.info(f"Creating price table for {pair_name} with timeframe {timeframe}")
+        table.create(engine, checkfirst=True)
+        known_tables[table_name] = {
+            column.name: 'real' if isinstance(column.type, REAL) else 'double precision'
+            for column in table.columns if column.name != 'timestamp'
+        }
+    
+    return table
@@ -3,6 +3,7 @@ Test script for data updater.
 """
 import time
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 # Import utilities
 from drl_forex_trading_internal.utils.logger import setup_logging
@@ -143,18 +144,15 @@ def test_data_updater():
         logger.info("Testing run_scheduled_update...")
         
         # Mock the update_all_pairs method to avoid duplicate processing
-        original_update_all_pairs = updater.update_all_pairs
-        try:
-            # Replace with a mock that just returns success
-            updater.update_all_pairs = lambda **kwargs: {pair: True for pair in test_pairs}
-            
+        with patch.object(
+            updater,
+            "update_all_pairs",
+            autospec=True,
+            return_value={pair: True for pair in test_pairs}
+        ):
             # Run the scheduled update
             updater.run_scheduled_update()
             logger.info("Scheduled update simulation completed")
-            
-        finally:
-            # Restore the original method
-            updater.update_all_pairs = original_update_all_pairs
         
         # Test shutdown
         updater.shutdown()
@@ -0,0 +1,233 @@
+"""
+Unit tests for the NumPy code paths in the data modules.
+
+Each vectorized routine is checked against the pandas or datetime code it
+replaces. No MT5 terminal or PostgreSQL server is needed; keyset paging runs
+against an in-memory SQLite database.
+"""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, event, Column, Float, REAL, MetaData, Table
+from sqlalchemy.pool import StaticPool
+
+# Import utilities
+from drl_forex_trading_internal.utils.logger import setup_logging
+
+# Import data modules
+from drl_forex_trading_internal.data.database import DataManager, _decode_price_column
+from drl_forex_trading_internal.data.resampler import DataResampler, _reduce_ohlcv, _BUCKET_NS, resample_struct
+from drl_forex_trading_internal.data.updater import DataUpdater, _fuse_gaps
+from drl_forex_trading_internal.db.schema import _price_table_elements
+
+# Configure logging
+logger = setup_logging("tests.data_vectorized")
+
+# Every target timeframe the resampler supports
+TIMEFRAMES = ["5m", "15m", "30m", "1h", "4h", "1d"]
+
+PANDAS_AGG = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+def _make_m1_data(seed: int = 7, days: int = 4, keep: float = 0.7) -> pd.DataFrame:
+    """
+    Build sorted 1-minute OHLCV data with random missing minutes.
+
+    Args:
+        seed: Random seed
+        days: Number of days covered
+        keep: Fraction of minutes kept
+
+    Returns:
+        DataFrame indexed by time
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-04 21:37", periods=days * 1440, freq="1min", name="time")
+    index = index[rng.random(len(index)) < keep]
+
+    close = 1.08 + np.cumsum(rng.normal(0, 0.0002, len(index)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = rng.random(len(index)) * 0.0003
+
+    return pd.DataFrame(
+        {
+            'open': open_,
+            'high': np.maximum(open_, close) + spread,
+            'low': np.minimum(open_, close) - spread,
+            'close': close,
+            'volume': rng.integers(1, 500, len(index)).astype(np.float64)
+        },
+        index=index
+    )
+
+def _pandas_resample(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Resample with pandas, as resample_data does for data it can't reduce directly."""
+    return data.resample(DataResampler.TIMEFRAME_MAP[timeframe]).agg(PANDAS_AGG).dropna()
+
+def test_reduce_ohlcv():
+    """_reduce_ohlcv matches pandas resample for every timeframe."""
+    data = _make_m1_data()
+    for timeframe in TIMEFRAMES:
+        result = _reduce_ohlcv(data, _BUCKET_NS[timeframe])
+        pd.testing.assert_frame_equal(result, _pandas_resample(data, timeframe), check_freq=False)
+
+def test_resample_data_multi():
+    """resample_data_multi matches resampling each target with pandas."""
+    data = _make_m1_data(seed=11)
+    resampler = DataResampler(data_manager=MagicMock())
+
+    # Unsorted request order, with a duplicate
+    targets = ["1h", "5m", "1d", "4h", "15m", "30m", "1h"]
+    results = resampler.resample_data_multi(data, "1m", targets)
+
+    assert list(results) == ["1h", "5m", "1d", "4h", "15m", "30m"]
+    for timeframe in targets:
+        pd.testing.assert_frame_equal(results[timeframe], _pandas_resample(data, timeframe), check_freq=False)
+
+def test_resample_struct():
+    """resample_struct matches pandas resample on MT5-style rates arrays."""
+    data = _make_m1_data(seed=3)
+
+    rates = np.empty(len(data), dtype=[
+        ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+        ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')
+    ])
+    rates['time'] = data.index.to_numpy().astype('datetime64[s]').astype(np.int64)
+    for column in ['open', 'high', 'low', 'close']:
+        rates[column] = data[column].to_numpy()
+    rates['tick_volume'] = data['volume'].to_numpy().astype(np.uint64)
+    rates['spread'] = 0
+    rates['real_volume'] = 0
+
+    for timeframe in TIMEFRAMES:
+        result = resample_struct(rates, "1m", timeframe)
+        expected = _pandas_resample(data, timeframe)
+
+        np.testing.assert_array_equal(result['time'], expected.index.to_numpy())
+        for column in ['open', 'high', 'low', 'close', 'volume']:
+            np.testing.assert_array_equal(result[column], expected[column].to_numpy())
+        assert result['volume'].dtype == np.uint64
+
+def _make_updater(weekend_trading: bool = False) -> DataUpdater:
+    """Build a DataUpdater with the default market hours, without MT5 or database connections."""
+    updater = DataUpdater.__new__(DataUpdater)
+    updater.weekend_trading = weekend_trading
+    updater._open_hours = [0] * 7
+    updater._close_hours = [22] * 7
+    return updater
+
+def test_weekend_gap_mask():
+    """_weekend_gap_mask agrees with _is_weekend_gap, which uses datetime.weekday()."""
+    rng = np.random.default_rng(5)
+    starts = np.datetime64("2023-12-25T00:00") + rng.integers(0, 60 * 24 * 7 * 6, 5000).astype("timedelta64[m]")
+    ends = starts + rng.integers(1, 60 * 24 * 4, 5000).astype("timedelta64[m]")
+
+    # Boundary cases around the default Friday 22:00 close and Monday 00:00 open
+    edges = np.array([
+        ["2024-01-05T22:00", "2024-01-08T00:00"],  # Friday close to Monday open
+        ["2024-01-05T21:59", "2024-01-08T00:00"],  # Starts before the close
+        ["2024-01-05T22:00", "2024-01-08T00:59"],  # Ends within the opening hour
+        ["2024-01-05T22:00", "2024-01-08T01:00"],  # Ends after the opening hour
+        ["2024-01-04T23:00", "2024-01-08T00:00"],  # Starts on Thursday
+        ["1969-12-26T23:00", "1969-12-29T00:00"],  # Before the epoch
+    ], dtype="datetime64[ns]")
+    bounds = np.concatenate((np.stack((starts, ends), axis=1).astype("datetime64[ns]"), edges))
+
+    updater = _make_updater()
+    expected = [
+        updater._is_weekend_gap(pd.Timestamp(start).to_pydatetime(), pd.Timestamp(end).to_pydatetime())
+        for start, end in bounds
+    ]
+    np.testing.assert_array_equal(updater._weekend_gap_mask(bounds), expected)
+    assert list(expected[-6:]) == [True, False, True, False, False, True]
+
+    assert not _make_updater(weekend_trading=True)._weekend_gap_mask(bounds).any()
+
+def test_fuse_gaps():
+    """Close gaps are merged into one window, bounded by the maximum window length."""
+    t0 = datetime(2024, 1, 8)
+    minutes = lambda n: t0 + timedelta(minutes=n)
+    fuse_gap = timedelta(minutes=5)
+
+    gaps = [
+        (minutes(0), minutes(10)),
+        (minutes(14), minutes(20)),   # 4 minutes after: fused
+        (minutes(16), minutes(18)),   # Inside the previous window: fused without shrinking it
+        (minutes(25), minutes(30)),   # 5 minutes after: kept separate
+        (minutes(31), minutes(200)),  # Fusing would exceed the maximum: kept separate
+    ]
+    assert _fuse_gaps(gaps, fuse_gap, timedelta(minutes=120)) == [
+        (minutes(0), minutes(20)),
+        (minutes(25), minutes(30)),
+        (minutes(31), minutes(200)),
+    ]
+
+    # A larger maximum lets the last two fuse
+    assert _fuse_gaps(gaps, fuse_gap, timedelta(days=1))[-1] == (minutes(25), minutes(200))
+
+    assert _fuse_gaps([], fuse_gap, timedelta(days=1)) == []
+
+def test_decode_price_column():
+    """REAL columns are decoded to the quoted prices; double precision columns are untouched."""
+    prices = np.array([1.08765, 0.65432, 151.234, 1.2345, 0.0, 98765.4, 0.00012345])
+    stored = prices.astype(np.float32).astype(np.float64)
+
+    # float4 reads come back with float32 noise
+    assert not np.array_equal(stored, prices)
+    np.testing.assert_array_equal(_decode_price_column(stored, Column('close', REAL)), prices)
+
+    # Double precision values keep every digit
+    doubles = prices + 1e-9
+    assert _decode_price_column(doubles, Column('close', Float)) is doubles
+
+def test_before_keyset_paging():
+    """Paging backwards with before returns every row once, each page in ascending order."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS price_data")
+
+    table = Table('eurusd_1m', MetaData(schema='price_data'), *_price_table_elements('eurusd_1m'))
+    table.create(engine)
+
+    times = [datetime(2024, 1, 8) + timedelta(minutes=i) for i in range(25)]
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {'timestamp': t, 'open': 1.0 + i, 'high': 2.0 + i, 'low': 0.5 + i, 'close': 1.5 + i, 'volume': float(i)}
+            for i, t in enumerate(times)
+        ])
+
+    data_manager = DataManager.__new__(DataManager)
+    data_manager.engine = engine
+
+    pages = []
+    with patch.object(data_manager, "_ensure_price_table", return_value=table):
+        cursor = times[-1] + timedelta(minutes=1)
+        while True:
+            page = data_manager.get_price_data("EURUSD", "1m", limit=10, before=cursor)
+            if page is None:
+                break
+            assert page.index.is_monotonic_increasing
+            pages.append(page)
+            cursor = page.index[0]
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+
+    combined = pd.concat(reversed(pages))
+    assert list(combined.index) == times
+    np.testing.assert_array_equal(combined['volume'].to_numpy(), np.arange(25, dtype=np.float64))
+
+if __name__ == "__main__":
+    for test in [
+        test_reduce_ohlcv,
+        test_resample_data_multi,
+        test_resample_struct,
+        test_weekend_gap_mask,
+        test_fuse_gaps,
+        test_decode_price_column,
+        test_before_keyset_paging,
+    ]:
+        test()
+        logger.info(f"{test.__name__} passed")
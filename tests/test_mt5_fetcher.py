@@ -38,10 +38,10 @@ def test_mt5_fetcher():
         symbol = "EURUSD"
         if symbol not in symbols:
             logger.warning(f"{symbol} not found in available symbols")
-            # Try to find a different currency pair
-            forex_pairs = [s for s in symbols if len(s) == 6 and s.isalpha()]
-            if forex_pairs:
-                symbol = forex_pairs[0]
+            # Try to find a different currency pair, stopping at the first match
+            forex_pair = next((s for s in symbols if len(s) == 6 and s.isalpha()), None)
+            if forex_pair:
+                symbol = forex_pair
                 logger.info(f"Using {symbol} for testing instead")
             else:
                 logger.error("No suitable forex pairs found for testing")
@@ -69,6 +69,19 @@ def test_mt5_fetcher():
         logger.info(f"Retrieved {len(df_range)} M15 candles for date range")
         logger.info(f"Date range data sample:\n{df_range.head()}")
         
+        # Fetch several pairs in one concurrent batch
+        batch_symbols = [s for s in ("EURUSD", "GBPUSD", "USDJPY") if s in symbols] or [symbol]
+        logger.info(f"Fetching last 100 M1 candles for {batch_symbols} in one batch")
+        batch = fetcher.fetch_ohlcv_many([
+            {"symbol": batch_symbol, "timeframe": "M1", "count": 100}
+            for batch_symbol in batch_symbols
+        ])
+        for (batch_symbol, _), df_batch in batch.items():
+            if df_batch is None or len(df_batch) == 0:
+                logger.error(f"Failed to fetch batched data for {batch_symbol}")
+                return False
+            logger.info(f"Retrieved {len(df_batch)} M1 candles for {batch_symbol} in batch")
+        
         # Test getting trading hours
         trading_hours = fetcher.get_trading_hours(symbol)
         logger.info(f"Trading hours for {symbol}: {trading_hours}")
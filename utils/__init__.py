@@ -1,7 +1,7 @@
 """
 Utilities package for the Forex AI Trading system.
 """
-from drl_forex_trading_internal.utils.config import load_config, get_project_root, get_module_root, get_absolute_path
+from drl_forex_trading_internal.utils.config import load_config, reload_config, get_project_root, get_module_root, get_absolute_path
 from drl_forex_trading_internal.utils.logger import get_logger, setup_logging
 
-__all__ = ["load_config", "get_project_root", "get_module_root", "get_absolute_path", "get_logger", "setup_logging"]
\ No newline at end of file
+__all__ = ["load_config", "reload_config", "get_project_root", "get_module_root", "get_absolute_path", "get_logger", "setup_logging"]
\ No newline at end of file
@@ -2,15 +2,55 @@
 Configuration utilities for the Forex AI Trading system.
 Handles loading from YAML files and environment variables.
 """
+import copy
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Tuple
 
+# Use the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Package directories, fixed for the life of the process
+_MODULE_ROOT = Path(__file__).parent.parent  # drl_forex_trading_internal directory
+_PROJECT_ROOT = _MODULE_ROOT.parent
+
+# Prefix of the environment variables that override configuration values
+_ENV_PREFIX = "FOREX_AI"
+
+# Environment variable name (without prefix) -> (config section, key)
+_ENV_SUFFIXES: Dict[str, Tuple[str, str]] = {
+    # Database credentials
+    "DB_HOST": ("database", "host"),
+    "DB_PORT": ("database", "port"),
+    "DB_NAME": ("database", "name"),
+    "DB_USER": ("database", "user"),
+    "DB_PASSWORD": ("database", "password"),
+    # MT5 credentials
+    "MT5_SERVER": ("mt5", "server"),
+    "MT5_LOGIN": ("mt5", "login"),
+    "MT5_PASSWORD": ("mt5", "password"),
+    # Paths
+    "PATH_MODELS": ("paths", "models"),
+    "PATH_LOGS": ("paths", "logs"),
+    "PATH_DATA": ("paths", "data"),
+}
+_ENV_MAPPINGS: Dict[str, Tuple[str, str]] = {
+    f"{_ENV_PREFIX}_{suffix}": target for suffix, target in _ENV_SUFFIXES.items()
+}
+
+@lru_cache(maxsize=None)
 def get_config_path(config_name: str = "main") -> Path:
     """
     Get the path to a configuration file.
     
+    The lookup is done once per config name; call reload_config() after
+    moving configuration files around.
+    
     Args:
         config_name: Name of the configuration file without extension
         
@@ -18,16 +58,13 @@ def get_config_path(config_name: str = "main") -> Path:
         Path to the configuration file
     """
     # First try to find the config file in the drl_forex_trading_internal directory
-    current_file_dir = Path(__file__).parent  # utils directory
-    module_root = current_file_dir.parent     # drl_forex_trading_internal directory
-    config_path = module_root / "config" / f"{config_name}.yml"
+    module_config_path = _MODULE_ROOT / "config" / f"{config_name}.yml"
     
-    if config_path.exists():
-        return config_path
+    if module_config_path.exists():
+        return module_config_path
     
     # If not found, try at the project root level
-    project_root = module_root.parent
-    config_path = project_root / "config" / f"{config_name}.yml"
+    config_path = _PROJECT_ROOT / "config" / f"{config_name}.yml"
     
     if config_path.exists():
         return config_path
@@ -40,18 +77,47 @@ def get_config_path(config_name: str = "main") -> Path:
             return config_path
     
     # Default to module config path (even if it doesn't exist)
-    return module_root / "config" / f"{config_name}.yml"
+    return module_config_path
 
 def load_config(config_name: str = "main") -> Dict[str, Any]:
     """
     Load configuration from a YAML file with environment variable overrides.
     
+    The file is parsed once per process; each call returns a fresh copy so
+    callers can modify it freely. Changes to the file or to environment
+    variables after the first load are not picked up until reload_config()
+    is called.
+    
     Args:
         config_name: Name of the configuration file without extension
         
     Returns:
         Dictionary containing configuration values
         
+    Raises:
+        FileNotFoundError: If the configuration file doesn't exist
+    """
+    return copy.deepcopy(_load_config_cached(config_name))
+
+def reload_config() -> None:
+    """
+    Forget cached configuration so the next load_config() re-reads the files
+    and environment variables.
+    """
+    _load_config_cached.cache_clear()
+    get_config_path.cache_clear()
+
+@lru_cache(maxsize=None)
+def _load_config_cached(config_name: str) -> Dict[str, Any]:
+    """
+    Parse a configuration file and apply environment variable overrides.
+    
+    Args:
+        config_name: Name of the configuration file without extension
+        
+    Returns:
+        Dictionary containing configuration values (shared; do not modify)
+        
     Raises:
         FileNotFoundError: If the configuration file doesn't exist
     """
@@ -60,15 +126,16 @@ def load_config(config_name: str = "main") -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_path, "r") as config_file:
-        config = yaml.safe_load(config_file)
+    # Bytes go straight to the parser, which detects the encoding itself
+    with open(config_path, "rb") as config_file:
+        config = yaml.load(config_file, Loader=_YamlLoader)
     
     # Override with environment variables if available
     _override_with_env_vars(config)
     
     return config
 
-def _override_with_env_vars(config: Dict[str, Any], prefix: str = "FOREX_AI") -> None:
+def _override_with_env_vars(config: Dict[str, Any], prefix: str = _ENV_PREFIX) -> None:
     """
     Override configuration values with environment variables.
     Environment variables should be in the format PREFIX_SECTION_KEY.
@@ -77,47 +144,25 @@ def _override_with_env_vars(config: Dict[str, Any], prefix: str = "FOREX_AI") ->
         config: Configuration dictionary to modify
         prefix: Prefix for environment variables
     """
-    # Override database credentials with environment variables if available
-    db_env_mappings = {
-        f"{prefix}_DB_HOST": ("database", "host"),
-        f"{prefix}_DB_PORT": ("database", "port"),
-        f"{prefix}_DB_NAME": ("database", "name"),
-        f"{prefix}_DB_USER": ("database", "user"),
-        f"{prefix}_DB_PASSWORD": ("database", "password"),
-    }
-    
-    # Override MT5 credentials with environment variables if available
-    mt5_env_mappings = {
-        f"{prefix}_MT5_SERVER": ("mt5", "server"),
-        f"{prefix}_MT5_LOGIN": ("mt5", "login"),
-        f"{prefix}_MT5_PASSWORD": ("mt5", "password"),
-    }
-    
-    # Override paths with environment variables if available
-    path_env_mappings = {
-        f"{prefix}_PATH_MODELS": ("paths", "models"),
-        f"{prefix}_PATH_LOGS": ("paths", "logs"),
-        f"{prefix}_PATH_DATA": ("paths", "data"),
-    }
-    
-    # Combine all mappings
-    all_mappings = {**db_env_mappings, **mt5_env_mappings, **path_env_mappings}
-    
-    for env_var, (section, key) in all_mappings.items():
-        if env_var in os.environ:
-            # Convert numeric values if needed
-            value = os.environ[env_var]
-            try:
-                if value.isdigit():
-                    value = int(value)
-                elif value.replace(".", "", 1).isdigit():
-                    value = float(value)
-            except (ValueError, AttributeError):
-                pass
-            
-            # Update config
-            if section in config:
-                config[section][key] = value
+    if prefix == _ENV_PREFIX:
+        mappings = _ENV_MAPPINGS
+    else:
+        mappings = {f"{prefix}_{suffix}": target for suffix, target in _ENV_SUFFIXES.items()}
+    
+    # Only the variables that are actually set
+    for env_var in mappings.keys() & os.environ.keys():
+        section, key = mappings[env_var]
+        
+        # Convert numeric values if needed
+        value = os.environ[env_var]
+        if value.isdigit():
+            value = int(value)
+        elif value.replace(".", "", 1).isdigit():
+            value = float(value)
+        
+        # Update config
+        if section in config:
+            config[section][key] = value
 
 def get_module_root() -> Path:
     """
@@ -126,9 +171,7 @@ def get_module_root() -> Path:
     Returns:
         Path to the module root directory
     """
-    current_file_dir = Path(__file__).parent  # utils directory
-    module_root = current_file_dir.parent     # drl_forex_trading_internal directory
-    return module_root
+    return _MODULE_ROOT
 
 def get_project_root() -> Path:
     """
@@ -138,7 +181,7 @@ def get_project_root() -> Path:
         Path to the project root directory
     """
     # The project root is one level up from the module root
-    return get_module_root().parent
+    return _PROJECT_ROOT
 
 def get_absolute_path(relative_path: str) -> Path:
     """
@@ -150,4 +193,4 @@ def get_absolute_path(relative_path: str) -> Path:
     Returns:
         Absolute path
     """
-    return get_module_root() / relative_path
\ No newline at end of file
+    return _MODULE_ROOT / relative_path
\ No newline at end of file
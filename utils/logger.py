@@ -1,59 +1,120 @@
 """
 Centralized logging configuration for the Forex AI Trading system.
 """
+import atexit
 import os
+import queue
 import logging
 import logging.handlers
+import threading
 from pathlib import Path
-from datetime import datetime
+from typing import Dict
 
 from drl_forex_trading_internal.utils.config import load_config, get_absolute_path
 
-def setup_logging(module_name: str = None) -> logging.Logger:
+# Set once the shared handlers are attached to the root logger
+_configured = False
+_CONFIGURE_LOCK = threading.Lock()
+
+# Loggers already returned by get_logger, keyed by module name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+class _BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
     """
-    Set up logging for a module with proper formatting and handlers.
+    Midnight-rotating file handler that buffers writes instead of flushing every record.
+    
+    Records at ERROR and above are flushed immediately, so they survive an
+    abrupt exit; the rest are written out by flush(), on rollover and on close.
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, buffering=64 * 1024)
+    
+    def emit(self, record):
+        # Same as the base emit, without the flush after every record
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that flushes buffered handlers whenever the queue runs empty.
+    
+    Bursts of records are written in large blocks, while a quiet log still
+    reaches the file as soon as the burst ends.
+    """
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, _BufferedTimedRotatingFileHandler):
+                    handler.flush()
+
+def _start_listener(log_queue: queue.Queue, *handlers: logging.Handler) -> logging.handlers.QueueListener:
+    """
+    Start a listener thread that passes queued records to the given handlers.
     
     Args:
-        module_name: Name of the module requesting a logger
+        log_queue: Queue the root logger's QueueHandler writes to
+        handlers: Handlers that do the actual output
         
     Returns:
-        Configured logger instance
+        The running QueueListener
+    """
+    listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    
+    # Flush queued records on shutdown; registered per listener so forked children stop their own
+    atexit.register(listener.stop)
+    return listener
+
+def _ensure_root_configured() -> None:
     """
-    # Load configuration
-    config = load_config()
+    Attach the process-wide file and console handlers to the root logger.
     
-    # Create logs directory if it doesn't exist
-    logs_dir = get_absolute_path(config["paths"]["logs"])
-    os.makedirs(logs_dir, exist_ok=True)
+    Runs once per process. Module loggers propagate to these handlers, so
+    every module shares one open log file; the logger name in each record
+    identifies the source module. The handlers run on a background listener
+    thread fed through a queue, so logging never blocks on file I/O.
+    """
+    global _configured
     
-    # Get logger
-    logger_name = module_name if module_name else "forex_ai"
-    logger = logging.getLogger(logger_name)
+    if _configured:
+        return
     
-    # Only configure handlers if they haven't been set up yet
-    if not logger.handlers:
-        # Set log level (default to INFO if not specified)
-        log_level_name = os.environ.get("FOREX_AI_LOG_LEVEL", "INFO")
-        log_level = getattr(logging, log_level_name, logging.INFO)
-        logger.setLevel(log_level)
+    with _CONFIGURE_LOCK:
+        if _configured:
+            return
+        
+        # Load configuration
+        config = load_config()
+        
+        # Create logs directory if it doesn't exist
+        logs_dir = get_absolute_path(config["paths"]["logs"])
+        os.makedirs(logs_dir, exist_ok=True)
         
         # Create formatters
         fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         date_fmt = "%Y-%m-%d %H:%M:%S"
         formatter = logging.Formatter(fmt=fmt, datefmt=date_fmt)
         
-        # Create file handler for the module
-        today = datetime.now().strftime("%Y-%m-%d")
-        if module_name:
-            log_file = logs_dir / f"{module_name}_{today}.log"
-        else:
-            log_file = logs_dir / f"forex_ai_{today}.log"
-            
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=10 * 1024 * 1024,  # 10 MB
+        # Create the shared file handler, rolled over at midnight (kept as forex_ai.log.YYYY-MM-DD)
+        file_handler = _BufferedTimedRotatingFileHandler(
+            logs_dir / "forex_ai.log",
+            when="midnight",
             backupCount=10,
-            encoding="utf-8"
+            encoding="utf-8",
+            delay=True  # Don't open the file until the first record
         )
         file_handler.setFormatter(formatter)
         
@@ -61,9 +122,39 @@ def setup_logging(module_name: str = None) -> logging.Logger:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Logging threads only enqueue records; a listener thread does the writes
+        log_queue = queue.Queue(-1)
+        _start_listener(log_queue, file_handler, console_handler)
+        
+        if hasattr(os, "register_at_fork"):
+            # Forked workers (the updater's process pool on Linux) don't inherit the listener thread
+            os.register_at_fork(after_in_child=lambda: _start_listener(log_queue, file_handler, console_handler))
+        
+        # The root level is left alone, so third-party loggers stay at their own thresholds
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        _configured = True
+
+def setup_logging(module_name: str = None) -> logging.Logger:
+    """
+    Set up logging for a module with proper formatting and handlers.
+    
+    Args:
+        module_name: Name of the module requesting a logger
+    
+    Returns:
+        Configured logger instance
+    """
+    _ensure_root_configured()
+    
+    # Get logger
+    logger_name = module_name if module_name else "forex_ai"
+    logger = logging.getLogger(logger_name)
+    
+    # Set log level (default to INFO if not specified)
+    if logger.level == logging.NOTSET:
+        log_level_name = os.environ.get("FOREX_AI_LOG_LEVEL", "INFO")
+        logger.setLevel(getattr(logging, log_level_name, logging.INFO))
         
         logger.info(f"Logging initialized for {logger_name}")
     
@@ -75,8 +166,12 @@ def get_logger(module_name: str) -> logging.Logger:
     
     Args:
         module_name: Name of the module requesting a logger
-        
+    
     Returns:
         Logger instance
     """
-    return setup_logging(module_name)
\ No newline at end of file
+    logger = _LOGGER_CACHE.get(module_name)
+    if logger is None:
+        logger = setup_logging(module_name)
+        _LOGGER_CACHE[module_name] = logger
+    return logger